@@ -66,10 +66,10 @@ def webhook():
                 logger.error("Telegram handler не инициализирован")
                 return {"status": "error", "message": "Bot not initialized"}, 503
         else:
-            logger.warning(f"Неверный content-type: {request.headers.get('content-type')}")
+            logger.warning("Неверный content-type: %s", request.headers.get('content-type'))
             return {"status": "error", "message": "Invalid content type"}, 400
     except Exception as e:
-        logger.error(f"Ошибка при обработке webhook: {e}", exc_info=True)
+        logger.error("Ошибка при обработке webhook: %s", e, exc_info=True)
         return {"status": "error", "message": str(e)}, 500
 
 
@@ -82,7 +82,7 @@ def publish_news_job():
         if telegram_handler:
             telegram_handler.publish_scheduled_news()
     except Exception as e:
-        logger.error(f"Ошибка в задаче публикации: {e}")
+        logger.error("Ошибка в задаче публикации: %s", e)
 
 
 def cleanup_old_news_job():
@@ -94,9 +94,9 @@ def cleanup_old_news_job():
     try:
         if database:
             deleted_count = database.delete_old_published_news(days=7)
-            logger.info(f"Автоматическая очистка БД: удалено {deleted_count} старых статей")
+            logger.info("Автоматическая очистка БД: удалено %s старых статей", deleted_count)
     except Exception as e:
-        logger.error(f"Ошибка в задаче очистки БД: {e}")
+        logger.error("Ошибка в задаче очистки БД: %s", e)
 
 
 def setup_scheduler():
@@ -120,7 +120,7 @@ def setup_scheduler():
             name=f'Публикация новостей в {hour}:00 (Madrid)',
             replace_existing=True
         )
-        logger.info(f"Добавлена задача публикации на {hour}:00 (Madrid time)")
+        logger.info("Добавлена задача публикации на %s:00 (Madrid time)", hour)
     # Добавляем задачу очистки старых статей (запуск каждый день в 3:00 по времени Мадрида)
     cleanup_trigger = CronTrigger(hour=3, minute=0, timezone=MADRID_TZ)
     scheduler.add_job(
@@ -151,9 +151,7 @@ def start_bot():
         # Загрузка настроек из БД (приоритет над .env)
         Config.init_from_database(database)
         logger.info("Настройки загружены из базы данных")
-        logger.info(f"Текущие настройки: PUBLISH_SCHEDULE={Config.PUBLISH_SCHEDULE}, "
-                   f"ARTICLE_STYLE={Config.ARTICLE_STYLE}, "
-                   f"URGENT_KEYWORDS={Config.URGENT_KEYWORDS}")
+        logger.info("Текущие настройки: PUBLISH_SCHEDULE=%s, ARTICLE_STYLE=%s, URGENT_KEYWORDS=%s", Config.PUBLISH_SCHEDULE, Config.ARTICLE_STYLE, Config.URGENT_KEYWORDS)
 
         # Создание обработчика с передачей database
         telegram_handler = TelegramHandler(database=database)
@@ -163,7 +161,7 @@ def start_bot():
         telegram_handler.start_polling()
 
     except Exception as e:
-        logger.error(f"Ошибка при запуске бота: {e}")
+        logger.error("Ошибка при запуске бота: %s", e)
         raise
 
 
@@ -182,9 +180,7 @@ def start_bot_webhook():
         # Загрузка настроек из БД (приоритет над .env)
         Config.init_from_database(database)
         logger.info("Настройки загружены из базы данных")
-        logger.info(f"Текущие настройки: PUBLISH_SCHEDULE={Config.PUBLISH_SCHEDULE}, "
-                   f"ARTICLE_STYLE={Config.ARTICLE_STYLE}, "
-                   f"URGENT_KEYWORDS={Config.URGENT_KEYWORDS}")
+        logger.info("Текущие настройки: PUBLISH_SCHEDULE=%s, ARTICLE_STYLE=%s, URGENT_KEYWORDS=%s", Config.PUBLISH_SCHEDULE, Config.ARTICLE_STYLE, Config.URGENT_KEYWORDS)
 
         # Создание обработчика с передачей database
         telegram_handler = TelegramHandler(database=database)
@@ -194,7 +190,7 @@ def start_bot_webhook():
         telegram_handler.start_webhook()
 
     except Exception as e:
-        logger.error(f"Ошибка при запуске бота в режиме webhook: {e}")
+        logger.error("Ошибка при запуске бота в режиме webhook: %s", e)
         raise
 
 
@@ -223,7 +219,7 @@ def run_bot():
     except KeyboardInterrupt:
         logger.info("Получен сигнал остановки")
     except Exception as e:
-        logger.error(f"Критическая ошибка: {e}")
+        logger.error("Критическая ошибка: %s", e)
     finally:
         # Остановка бота
         stop_bot()
@@ -236,8 +232,8 @@ if __name__ == '__main__':
         # Запуск в режиме webhook с Flask
         logger.info("========================================")
         logger.info("Запуск бота в режиме WEBHOOK")
-        logger.info(f"Webhook URL: {Config.WEBHOOK_URL}{Config.WEBHOOK_PATH}")
-        logger.info(f"Flask будет слушать на {Config.FLASK_HOST}:{Config.FLASK_PORT}")
+        logger.info("Webhook URL: %s%s", Config.WEBHOOK_URL, Config.WEBHOOK_PATH)
+        logger.info("Flask будет слушать на %s:%s", Config.FLASK_HOST, Config.FLASK_PORT)
         logger.info("========================================")
 
         # Настройка планировщика
@@ -2,6 +2,7 @@
 Конфигурация бота
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from typing import Optional, TYPE_CHECKING
 
@@ -89,17 +90,19 @@ class Config:
         """
         cls._db = db
 
-        # Загружаем настройки из БД (с fallback на текущие значения)
-        cls.PUBLISH_SCHEDULE = db.get_config('PUBLISH_SCHEDULE', cls.PUBLISH_SCHEDULE)
-        cls.URGENT_KEYWORDS = db.get_config('URGENT_KEYWORDS', cls.URGENT_KEYWORDS)
-        cls.ARTICLE_STYLE = db.get_config('ARTICLE_STYLE', cls.ARTICLE_STYLE)
-        cls.TEXT_LENGTH = db.get_config('TEXT_LENGTH', cls.TEXT_LENGTH)
-        cls.MONITOR_FROM_DATE = db.get_config('MONITOR_FROM_DATE', cls.MONITOR_FROM_DATE)
+        # Загружаем все настройки одним запросом (с fallback на текущие значения)
+        db_config = db.get_all_config()
 
-        max_articles = db.get_config('MAX_ARTICLES_PER_RUN', str(cls.MAX_ARTICLES_PER_RUN))
+        cls.PUBLISH_SCHEDULE = db_config.get('PUBLISH_SCHEDULE', cls.PUBLISH_SCHEDULE)
+        cls.URGENT_KEYWORDS = db_config.get('URGENT_KEYWORDS', cls.URGENT_KEYWORDS)
+        cls.ARTICLE_STYLE = db_config.get('ARTICLE_STYLE', cls.ARTICLE_STYLE)
+        cls.TEXT_LENGTH = db_config.get('TEXT_LENGTH', cls.TEXT_LENGTH)
+        cls.MONITOR_FROM_DATE = db_config.get('MONITOR_FROM_DATE', cls.MONITOR_FROM_DATE)
+
+        max_articles = db_config.get('MAX_ARTICLES_PER_RUN', str(cls.MAX_ARTICLES_PER_RUN))
         cls.MAX_ARTICLES_PER_RUN = int(max_articles)
 
-        check_interval = db.get_config('CHECK_INTERVAL', str(cls.CHECK_INTERVAL))
+        check_interval = db_config.get('CHECK_INTERVAL', str(cls.CHECK_INTERVAL))
         cls.CHECK_INTERVAL = int(check_interval)
 
     @classmethod
@@ -143,15 +146,27 @@ class Config:
             return True
         return False
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _parse_publish_hours(schedule: str) -> tuple:
+        """Разбор строки расписания (кэшируется по самой строке, поэтому сброс при изменении не нужен)"""
+        return tuple(int(h.strip()) for h in schedule.split(','))
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _parse_urgent_keywords(keywords: str) -> tuple:
+        """Разбор строки ключевых слов (кэшируется по самой строке)"""
+        return tuple(kw.strip().lower() for kw in keywords.split(','))
+
     @classmethod
     def get_publish_hours(cls) -> list:
         """Получить часы публикации в виде списка"""
-        return [int(h.strip()) for h in cls.PUBLISH_SCHEDULE.split(',')]
+        return list(cls._parse_publish_hours(cls.PUBLISH_SCHEDULE))
 
     @classmethod
     def get_urgent_keywords(cls) -> list:
         """Получить список ключевых слов для срочных новостей"""
-        return [kw.strip().lower() for kw in cls.URGENT_KEYWORDS.split(',')]
+        return list(cls._parse_urgent_keywords(cls.URGENT_KEYWORDS))
 
     @classmethod
     def get_article_style(cls) -> str:
@@ -168,8 +183,8 @@ class Config:
     @classmethod
     def get_text_length_chars(cls) -> int:
         """Получить длину текста в символах"""
-        length_type = cls.get_text_length()
-        return cls.AVAILABLE_TEXT_LENGTHS.get(length_type, 2000)
+        # get_text_length() всегда возвращает допустимый ключ
+        return cls.AVAILABLE_TEXT_LENGTHS[cls.get_text_length()]
 
     @classmethod
     def get_monitor_from_date(cls) -> str:
@@ -13,6 +13,12 @@ from timezone_utils import now_madrid
 
 logger = logging.getLogger(__name__)
 
+# Максимум соединений в пуле. Пул не ждет свободного соединения, а сразу выдает
+# PoolError, поэтому лимит должен покрывать все потоки, которые одновременно
+# работают с БД: обработчики telebot (8), загрузка статей (4), обработка
+# сообщений канала (2), переписывание (2), публикация (1) и задачи APScheduler
+DB_POOL_MAX_CONNECTIONS = 20
+
 
 class NewsDatabase:
     """Класс для работы с PostgreSQL БД очереди новостей"""
@@ -43,15 +49,16 @@ class NewsDatabase:
                 self.database_url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}?sslmode={db_sslmode}"
 
         # Создаем connection pool для лучшей производительности
+        # (ThreadedConnectionPool - соединения берут потоки обработчиков и фоновые пулы)
         try:
-            self.connection_pool = pool.SimpleConnectionPool(
+            self.connection_pool = pool.ThreadedConnectionPool(
                 1,  # минимум соединений
-                10, # максимум соединений
+                DB_POOL_MAX_CONNECTIONS,
                 self.database_url
             )
             logger.info("Connection pool к PostgreSQL успешно создан")
         except Exception as e:
-            logger.error(f"Ошибка создания connection pool: {e}")
+            logger.error("Ошибка создания connection pool: %s", e)
             raise
 
         self._init_database()
@@ -65,7 +72,7 @@ class NewsDatabase:
             conn.commit()
         except Exception as e:
             conn.rollback()
-            logger.error(f"Ошибка работы с БД: {e}")
+            logger.error("Ошибка работы с БД: %s", e)
             raise
         finally:
             self.connection_pool.putconn(conn)
@@ -175,14 +182,14 @@ class NewsDatabase:
                 ''', (url, title, original_text, processed_text, scheduled_time, is_urgent))
 
                 news_id = cursor.fetchone()[0]
-                logger.info(f"Новость добавлена в очередь: ID={news_id}, URL={url}")
+                logger.info("Новость добавлена в очередь: ID=%s, URL=%s", news_id, url)
                 return news_id
 
         except errors.UniqueViolation:
-            logger.warning(f"Новость с URL {url} уже существует в очереди")
+            logger.warning("Новость с URL %s уже существует в очереди", url)
             return None
         except Exception as e:
-            logger.error(f"Ошибка при добавлении новости: {e}")
+            logger.error("Ошибка при добавлении новости: %s", e)
             return None
 
     def get_news_for_publication(self, limit: int = 1) -> List[Dict]:
@@ -193,12 +200,14 @@ class NewsDatabase:
             limit: Количество новостей
 
         Returns:
-            Список новостей
+            Список новостей (без original_text)
         """
         with self._get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
+            # original_text (исходная статья) для публикации не нужен - не передаем его из БД
             cursor.execute('''
-                SELECT * FROM news_queue
+                SELECT id, url, title, processed_text, scheduled_time, is_urgent
+                FROM news_queue
                 WHERE status = 'pending'
                 AND scheduled_time <= %s
                 ORDER BY is_urgent DESC, scheduled_time ASC
@@ -248,11 +257,11 @@ class NewsDatabase:
                     WHERE id = %s
                 ''', (now_madrid(), news_id))
 
-                logger.info(f"Новость ID={news_id} отмечена как опубликованная")
+                logger.info("Новость ID=%s отмечена как опубликованная", news_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Ошибка при обновлении статуса новости: {e}")
+            logger.error("Ошибка при обновлении статуса новости: %s", e)
             return False
 
     def mark_as_failed(self, news_id: int) -> bool:
@@ -274,11 +283,11 @@ class NewsDatabase:
                     WHERE id = %s
                 ''', (news_id,))
 
-                logger.info(f"Новость ID={news_id} отмечена как неудачная")
+                logger.info("Новость ID=%s отмечена как неудачная", news_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Ошибка при обновлении статуса новости: {e}")
+            logger.error("Ошибка при обновлении статуса новости: %s", e)
             return False
 
     def get_queue_status(self) -> Dict:
@@ -291,14 +300,15 @@ class NewsDatabase:
         with self._get_connection() as conn:
             cursor = conn.cursor(cursor_factory=RealDictCursor)
 
-            # Общая статистика
+            # Общая статистика одним проходом по таблице
+            # (COUNT ... FILTER возвращает 0, а не NULL, для пустой таблицы)
             cursor.execute('''
                 SELECT
                     COUNT(*) as total,
-                    SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(CASE WHEN status = 'published' THEN 1 ELSE 0 END) as published,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN is_urgent = TRUE THEN 1 ELSE 0 END) as urgent
+                    COUNT(*) FILTER (WHERE status = 'pending') as pending,
+                    COUNT(*) FILTER (WHERE status = 'published') as published,
+                    COUNT(*) FILTER (WHERE status = 'failed') as failed,
+                    COUNT(*) FILTER (WHERE is_urgent = TRUE) as urgent
                 FROM news_queue
             ''')
 
@@ -318,9 +328,13 @@ class NewsDatabase:
 
             return stats
 
-    def get_pending_news(self) -> List[Dict]:
+    def get_pending_news(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
         """
-        Получить все новости в очереди
+        Получить новости в очереди
+
+        Args:
+            limit: Максимальное количество новостей (None - все)
+            offset: Сколько новостей пропустить (для постраничного вывода)
 
         Returns:
             Список новостей
@@ -331,11 +345,24 @@ class NewsDatabase:
                 SELECT id, title, url, scheduled_time, is_urgent
                 FROM news_queue
                 WHERE status = 'pending'
-                ORDER BY scheduled_time ASC
-            ''')
+                ORDER BY scheduled_time ASC, id ASC
+                LIMIT %s OFFSET %s
+            ''', (limit, offset))
 
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_pending_count(self) -> int:
+        """
+        Получить количество новостей в очереди
+
+        Returns:
+            Количество новостей со статусом pending
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM news_queue WHERE status = 'pending'")
+            return cursor.fetchone()[0]
+
     def delete_news(self, news_id: int) -> bool:
         """
         Удалить новость из очереди
@@ -350,11 +377,11 @@ class NewsDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('DELETE FROM news_queue WHERE id = %s', (news_id,))
-                logger.info(f"Новость ID={news_id} удалена из очереди")
+                logger.info("Новость ID=%s удалена из очереди", news_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Ошибка при удалении новости: {e}")
+            logger.error("Ошибка при удалении новости: %s", e)
             return False
 
     def clear_queue(self) -> bool:
@@ -372,7 +399,7 @@ class NewsDatabase:
                 return True
 
         except Exception as e:
-            logger.error(f"Ошибка при очистке очереди: {e}")
+            logger.error("Ошибка при очистке очереди: %s", e)
             return False
 
     def get_news_by_id(self, news_id: int) -> Optional[Dict]:
@@ -391,6 +418,21 @@ class NewsDatabase:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def url_exists(self, url: str) -> bool:
+        """
+        Проверить, есть ли новость с таким URL в БД (в любом статусе)
+
+        Args:
+            url: URL новости
+
+        Returns:
+            True если новость уже есть
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1 FROM news_queue WHERE url = %s LIMIT 1', (url,))
+            return cursor.fetchone() is not None
+
     def update_processed_text(self, news_id: int, new_processed_text: str) -> bool:
         """
         Обновить обработанный текст новости (для переписывания)
@@ -411,11 +453,11 @@ class NewsDatabase:
                     WHERE id = %s
                 ''', (new_processed_text, now_madrid(), news_id))
 
-                logger.info(f"Текст новости ID={news_id} обновлен (переписан)")
+                logger.info("Текст новости ID=%s обновлен (переписан)", news_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Ошибка при обновлении текста новости: {e}")
+            logger.error("Ошибка при обновлении текста новости: %s", e)
             return False
 
     # === Методы для работы с настройками бота ===
@@ -438,7 +480,7 @@ class NewsDatabase:
                 row = cursor.fetchone()
                 return row[0] if row else default
         except Exception as e:
-            logger.error(f"Ошибка при получении настройки {key}: {e}")
+            logger.error("Ошибка при получении настройки %s: %s", key, e)
             return default
 
     def set_config(self, key: str, value: str) -> bool:
@@ -461,10 +503,10 @@ class NewsDatabase:
                     ON CONFLICT (key) DO UPDATE
                     SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at
                 ''', (key, value, now_madrid()))
-                logger.info(f"Настройка {key} обновлена: {value}")
+                logger.info("Настройка %s обновлена: %s", key, value)
                 return True
         except Exception as e:
-            logger.error(f"Ошибка при установке настройки {key}: {e}")
+            logger.error("Ошибка при установке настройки %s: %s", key, e)
             return False
 
     def get_all_config(self) -> Dict[str, str]:
@@ -476,12 +518,11 @@ class NewsDatabase:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor(cursor_factory=RealDictCursor)
-                cursor.execute('SELECT key, value, updated_at FROM bot_config')
-                rows = cursor.fetchall()
-                return {row['key']: row['value'] for row in rows}
+                cursor = conn.cursor()
+                cursor.execute('SELECT key, value FROM bot_config')
+                return dict(cursor.fetchall())
         except Exception as e:
-            logger.error(f"Ошибка при получении всех настроек: {e}")
+            logger.error("Ошибка при получении всех настроек: %s", e)
             return {}
 
     def delete_old_published_news(self, days: int = 7) -> int:
@@ -508,13 +549,13 @@ class NewsDatabase:
                 deleted_count = len(deleted_ids)
 
                 if deleted_count > 0:
-                    logger.info(f"Удалено {deleted_count} старых опубликованных статей (старше {days} дней)")
+                    logger.info("Удалено %s старых опубликованных статей (старше %s дней)", deleted_count, days)
                 else:
-                    logger.debug(f"Нет опубликованных статей старше {days} дней для удаления")
+                    logger.debug("Нет опубликованных статей старше %s дней для удаления", days)
 
                 return deleted_count
         except Exception as e:
-            logger.error(f"Ошибка при удалении старых статей: {e}")
+            logger.error("Ошибка при удалении старых статей: %s", e)
             return 0
 
     def close(self):
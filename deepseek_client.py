@@ -75,14 +75,14 @@ class DeepSeekClient:
             response = self._make_request(prompt)
 
             if response:
-                logger.info(f"Успешно обработана статья: {article_data.get('title')}")
+                logger.info("Успешно обработана статья: %s", article_data.get('title'))
                 return response
             else:
                 logger.error("Не получен ответ от DeepSeek API")
                 return None
 
         except Exception as e:
-            logger.error(f"Ошибка при обработке статьи через DeepSeek: {e}")
+            logger.error("Ошибка при обработке статьи через DeepSeek: %s", e)
             return None
 
     def _create_prompt(self, article_data: Dict[str, str]) -> str:
@@ -183,11 +183,11 @@ class DeepSeekClient:
             if response.choices and len(response.choices) > 0:
                 return response.choices[0].message.content
             else:
-                logger.error(f"Неожиданный формат ответа от API: {response}")
+                logger.error("Неожиданный формат ответа от API: %s", response)
                 return None
 
         except Exception as e:
-            logger.error(f"Ошибка при работе с DeepSeek API: {e}")
+            logger.error("Ошибка при работе с DeepSeek API: %s", e)
             return None
 
     def set_style(self, style: str):
@@ -199,9 +199,9 @@ class DeepSeekClient:
         """
         if style.lower() in Config.AVAILABLE_STYLES:
             self.style = style.lower()
-            logger.info(f"Стиль изменен на: {self.style}")
+            logger.info("Стиль изменен на: %s", self.style)
         else:
-            logger.warning(f"Неизвестный стиль: {style}. Доступны: {', '.join(Config.AVAILABLE_STYLES)}")
+            logger.warning("Неизвестный стиль: %s. Доступны: %s", style, ', '.join(Config.AVAILABLE_STYLES))
 
     def get_style(self) -> str:
         """Получить текущий стиль написания"""
@@ -220,51 +220,42 @@ class DeepSeekClient:
         Returns:
             Переписанный текст или None в случае ошибки
         """
-        try:
-            # Временно сохраняем текущий стиль
-            original_style = self.style
-
-            # Устанавливаем новый стиль если указан
-            if new_style:
-                self.style = new_style
+        # Стиль передается в промпт напрямую, а не через self.style: переписывание
+        # выполняется в фоне параллельно с обработкой новых статей
+        style = new_style or self.style
 
-            # Создаем промпт с указанной длиной или текущей
-            prompt = self._create_rewrite_prompt(article_data, text_length)
+        try:
+            # Создаем промпт с указанными стилем и длиной или текущими
+            prompt = self._create_rewrite_prompt(article_data, text_length, style)
 
             # Делаем запрос
             response = self._make_request(prompt)
 
-            # Восстанавливаем оригинальный стиль
-            self.style = original_style
-
             if response:
-                logger.info(f"Успешно переписана статья: {article_data.get('title')} "
-                          f"(стиль: {new_style or original_style}, длина: {text_length or 'текущая'})")
+                logger.info("Успешно переписана статья: %s (стиль: %s, длина: %s)", article_data.get('title'), style, text_length or 'текущая')
                 return response
             else:
                 logger.error("Не получен ответ от DeepSeek API при переписывании")
                 return None
 
         except Exception as e:
-            # Восстанавливаем оригинальный стиль в случае ошибки
-            self.style = original_style
-            logger.error(f"Ошибка при переписывании статьи через DeepSeek: {e}")
+            logger.error("Ошибка при переписывании статьи через DeepSeek: %s", e)
             return None
 
-    def _create_rewrite_prompt(self, article_data: Dict[str, str], text_length: str = None) -> str:
+    def _create_rewrite_prompt(self, article_data: Dict[str, str], text_length: str = None,
+                               style: str = None) -> str:
         """
         Создание промпта для переписывания статьи
 
         Args:
             article_data: Данные статьи
             text_length: Желаемая длина текста
+            style: Стиль написания (если None - текущий)
 
         Returns:
             Промпт для API
         """
-        from config import Config
-
-        style_description = self.STYLE_DESCRIPTIONS.get(self.style, self.STYLE_DESCRIPTIONS['informative'])
+        style_description = self.STYLE_DESCRIPTIONS.get(style or self.style, self.STYLE_DESCRIPTIONS['informative'])
 
         # Получаем ограничение по длине текста
         if text_length:
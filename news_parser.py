@@ -2,7 +2,8 @@
 Модуль для парсинга новостных статей
 """
 import logging
-from newspaper import Article
+import requests
+from newspaper import Article, network
 from typing import Optional, Dict
 
 logger = logging.getLogger(__name__)
@@ -11,8 +12,32 @@ logger = logging.getLogger(__name__)
 class NewsParser:
     """Класс для извлечения контента из новостных статей"""
 
-    @staticmethod
-    def parse_article(url: str) -> Optional[Dict[str, str]]:
+    def __init__(self):
+        # Общая HTTP-сессия: keep-alive соединения переиспользуются между статьями
+        self.session = requests.Session()
+
+    def _download_html(self, article: Article) -> str:
+        """
+        Загрузка HTML статьи через общую сессию
+
+        Args:
+            article: Объект статьи newspaper
+
+        Returns:
+            HTML страницы
+        """
+        config = article.config
+        response = self.session.get(
+            article.url,
+            **network.get_request_kwargs(
+                config.request_timeout, config.browser_user_agent, config.proxies, config.headers
+            )
+        )
+        response.raise_for_status()
+        # Определение кодировки делегируем newspaper
+        return network.get_html_2XX_only(article.url, config, response=response)
+
+    def parse_article(self, url: str) -> Optional[Dict[str, str]]:
         """
         Парсинг статьи по URL
 
@@ -24,14 +49,14 @@ class NewsParser:
         """
         try:
             article = Article(url)
-            article.download()
+            article.download(input_html=self._download_html(article))
             article.parse()
 
             # Попытка извлечь дополнительную информацию
             try:
                 article.nlp()
             except Exception as e:
-                logger.warning(f"Не удалось выполнить NLP обработку для {url}: {e}")
+                logger.warning("Не удалось выполнить NLP обработку для %s: %s", url, e)
 
             result = {
                 'title': article.title,
@@ -44,11 +69,11 @@ class NewsParser:
                 'keywords': ', '.join(article.keywords) if hasattr(article, 'keywords') else ''
             }
 
-            logger.info(f"Успешно извлечена статья: {article.title}")
+            logger.info("Успешно извлечена статья: %s", article.title)
             return result
 
         except Exception as e:
-            logger.error(f"Ошибка при парсинге статьи {url}: {e}")
+            logger.error("Ошибка при парсинге статьи %s: %s", url, e)
             return None
 
     @staticmethod
@@ -67,11 +92,11 @@ class NewsParser:
             return False
 
         if not article_data.get('text') or len(article_data['text']) < min_length:
-            logger.warning(f"Статья слишком короткая или пустая: {article_data.get('url')}")
+            logger.warning("Статья слишком короткая или пустая: %s", article_data.get('url'))
             return False
 
         if not article_data.get('title'):
-            logger.warning(f"Статья без заголовка: {article_data.get('url')}")
+            logger.warning("Статья без заголовка: %s", article_data.get('url'))
             return False
 
         return True
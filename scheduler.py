@@ -58,16 +58,16 @@ class PublicationScheduler:
             for slot_time in available_slots:
                 news_count = db.get_next_slot_news_count(slot_time)
                 if news_count == 0:
-                    logger.info(f"Найден свободный слот: {slot_time}")
+                    logger.info("Найден свободный слот: %s", slot_time)
                     return slot_time
 
             # Если все слоты заняты, возвращаем последний слот (через 7 дней)
-            logger.warning(f"Все слоты заняты на 7 дней вперед. Используем последний слот: {available_slots[-1]}")
+            logger.warning("Все слоты заняты на 7 дней вперед. Используем последний слот: %s", available_slots[-1])
             return available_slots[-1]
         else:
             # Если база данных не передана, возвращаем первый доступный слот по времени
             slot_time = available_slots[0] if available_slots else now_madrid()
-            logger.info(f"База данных не передана. Используем первый слот: {slot_time}")
+            logger.info("База данных не передана. Используем первый слот: %s", slot_time)
             return slot_time
 
     def get_specific_slot(self, target_date: datetime, slot_index: int = 0) -> Optional[datetime]:
@@ -82,7 +82,7 @@ class PublicationScheduler:
             Время слота или None (с timezone Мадрида)
         """
         if slot_index >= len(self.publish_hours):
-            logger.warning(f"Неверный индекс слота: {slot_index}")
+            logger.warning("Неверный индекс слота: %s", slot_index)
             return None
 
         hour = sorted(self.publish_hours)[slot_index]
@@ -1,59 +1,495 @@
 """
 Обработчик для работы с Telegram
 """
+import functools
+import html
 import logging
 import re
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Callable, List, Optional
+import requests
 import telebot
-from telebot import types
+from requests.adapters import HTTPAdapter
+from telebot import apihelper, types
+from urllib3.util.retry import Retry
 from config import Config
 from database import NewsDatabase
+from deepseek_client import DeepSeekClient
+from news_parser import NewsParser
 from scheduler import PublicationScheduler
 from timezone_utils import to_madrid_tz
 
 logger = logging.getLogger(__name__)
 
+# Лимит длины сообщения Telegram и запас под служебные символы
+TG_MAX_MESSAGE_LENGTH = 4096
+TG_LENGTH_RESERVE = 100
+
+# Неизменяемые части подписи публикации (между ними подставляется URL источника)
+_FOOTER_PREFIX = '\n\nКанал: @iberia_news\n<a href="'
+_FOOTER_SUFFIX = '">Источник</a>'
+# Сколько символов остается на текст публикации без учета длины URL
+_TEXT_LENGTH_BUDGET = TG_MAX_MESSAGE_LENGTH - TG_LENGTH_RESERVE - len(_FOOTER_PREFIX) - len(_FOOTER_SUFFIX)
+
+# Максимальная длина сущности, которую создает html.escape (&quot; и &#x27;)
+_MAX_HTML_ENTITY_LENGTH = 6
+
+# Потоки пулов ниже одновременно берут соединения с БД - при увеличении пулов
+# нужно увеличить и DB_POOL_MAX_CONNECTIONS в database.py
+
+# Количество потоков telebot для обработчиков команд и callback запросов
+# (медленный ответ Telegram API в одном обработчике не задерживает остальные)
+HANDLER_WORKERS = 8
+
+# Количество потоков для обработки сообщений канала со ссылками
+MESSAGE_WORKERS = 2
+
+# Количество потоков для параллельной загрузки статей (общий пул для всех сообщений)
+URL_FETCH_WORKERS = 4
+
+# Количество одновременных переписываний статей через DeepSeek
+REWRITE_WORKERS = 2
+
+# Сколько раз повторять отправку публикации после ответа 429 (flood control)
+FLOOD_RETRY_ATTEMPTS = 3
+
+# Сколько недавно сохраненных URL помнить в памяти
+KNOWN_URLS_CACHE_SIZE = 10000
+
+# Кэш новостей по ID для экранов просмотра/подтверждения (размер и время жизни записи в секундах)
+NEWS_CACHE_SIZE = 256
+NEWS_CACHE_TTL = 30
+
+# Сколько последних состояний меню настроек помнить для пропуска повторных правок
+MENU_EDIT_CACHE_SIZE = 1024
+
+# Минимальный интервал между правками одного сообщения о ходе операции (секунды),
+# чтобы прогресс и результат подряд не попадали под flood control
+MIN_EDIT_INTERVAL = 0.8
+
+# Размер пула keep-alive соединений к api.telegram.org (с запасом на все рабочие потоки)
+TELEGRAM_POOL_SIZE = 16
+
+# Время удержания long polling запроса сервером Telegram (максимум, который допускает API)
+LONG_POLLING_TIMEOUT = 50
+
+# Типы обновлений, для которых у бота есть обработчики; остальные Telegram не присылает
+ALLOWED_UPDATES = ['message', 'channel_post', 'callback_query']
+
+# Регулярное выражение для поиска ссылок (компилируется один раз при импорте)
+# Допустимые символы собраны в один класс, чтобы не перебирать альтернативы на каждом символе
+# (диапазон $-_ - это символы 0x24-0x5F: цифры, A-Z, '/', ':', '?', '=', а также обратная косая черта, '[', ']' и '^')
+_URL_RE = re.compile(r'https?://(?:[a-zA-Z0-9$-_@.&+!*(),]|%[0-9a-fA-F]{2})+')
+
+# Разбор действий меню переписывания из callback_data (ключи стилей и длин - латиница)
+_REWRITE_STYLE_RE = re.compile(r'style_(?P<style>[a-z]+)_(?P<mode>style_only|both)$')
+_REWRITE_LENGTH_RE = re.compile(
+    r'length_(?P<length>[a-z]+)_(?:with_style_(?P<style>[a-z]+)|length_only|both)$'
+)
+_REWRITE_CONFIRM_RE = re.compile(
+    r'confirm_(?:current|style_(?P<style>[a-z]+)|length_(?P<length>[a-z]+)'
+    r'|both_(?P<both_style>[a-z]+)_(?P<both_length>[a-z]+))$'
+)
+
+# Кнопка возврата в меню настроек (неизменяемая, общая для всех клавиатур)
+_BACK_TO_SETTINGS_BUTTON = types.InlineKeyboardButton("← Назад", callback_data="back_to_settings")
+
+# Разделитель между заголовком превью /view и текстом публикации
+_VIEW_RULE = '=' * 30
+
+# Кнопки навигации под превью публикации (неизменяемые)
+_VIEW_NAV_BUTTONS = (
+    types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue"),
+    types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status"),
+)
+
+
+def require_admin(command: str):
+    """
+    Декоратор команд, доступных только администратору
+
+    Args:
+        command: Название команды (для лога)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, message: types.Message, *args, **kwargs):
+            user_id = message.from_user.id
+            logger.info("Команда %s от пользователя ID: %s", command, user_id)
+
+            if not self._is_admin(user_id):
+                logger.warning("Отказано в доступе для пользователя %s", user_id)
+                self.bot.reply_to(
+                    message,
+                    f"❌ У вас нет прав для выполнения этой команды\n"
+                    f"Ваш ID: {user_id}\n"
+                    f"Требуется ID администратора (установите в .env файле ADMIN_USER_ID)"
+                )
+                return None
+
+            return func(self, message, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def command_errors(command: str, error_text: str = "Ошибка при выполнении команды"):
+    """
+    Декоратор команд: логирует необработанное исключение с трассировкой
+    и сообщает пользователю об ошибке
+
+    Args:
+        command: Название команды (для лога)
+        error_text: Текст ответа пользователю при ошибке
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, message: types.Message, *args, **kwargs):
+            try:
+                return func(self, message, *args, **kwargs)
+            except Exception:
+                logger.exception("Ошибка в команде %s", command)
+                self.bot.reply_to(message, error_text)
+                return None
+        return wrapper
+    return decorator
+
+
 class TelegramHandler:
     """Класс для работы с Telegram API"""
 
+    # Названия стилей и длин текста для кнопок меню
+    STYLE_NAMES = {
+        'informative': '📰 Информативный',
+        'ironic': '😏 Ироничный',
+        'cynical': '😒 Циничный',
+        'playful': '😄 Шутливый',
+        'mocking': '🤣 Стебной'
+    }
+
+    LENGTH_NAMES = {
+        'short': '📄 Короткий (1000 символов)',
+        'medium': '📃 Средний (2000 символов)',
+        'long': '📰 Длинный (3000 символов)'
+    }
+
+    # Значки статусов новостей для экрана просмотра
+    STATUS_EMOJI = {
+        'pending': '⏳',
+        'published': '✅',
+        'failed': '❌'
+    }
+
+    # Кнопки меню /rewrite: (название, действие в callback_data после rewrite_{id}_)
+    REWRITE_MENU_ACTIONS = (
+        ("📝 Изменить только стиль", "select_style_only"),
+        ("📏 Изменить только длину", "select_length_only"),
+        ("🔄 Изменить стиль И длину", "select_both"),
+        ("✅ Переписать с текущими настройками", "confirm_current"),
+    )
+
+    # Список доступных стилей для сообщений об ошибке (по одному в строке)
+    STYLES_LIST_TEXT = '\n'.join(f"- {style}" for style in Config.AVAILABLE_STYLES)
+
+    # Текст /help (не зависит от текущих настроек)
+    HELP_TEXT = f"""
+Доступные команды:
+
+📋 Основные:
+/start - Информация о боте
+/status - Статус очереди новостей
+/queue - Показать новости в очереди
+/help - Это сообщение
+
+⚙️ Настройки (админ):
+/settings - Интерактивное меню настроек (кнопки)
+/set_style [style] - Изменить стиль написания
+/get_style - Показать текущий стиль
+/config - Показать все настройки
+/set_config [key] [value] - Изменить настройку
+/reload_config - Перезагрузить настройки
+
+📰 Публикации (админ):
+/view [id] - Просмотр публикации по ID
+/rewrite [id] - Переписать статью с новым стилем/длиной
+/publishnow [id] - Опубликовать немедленно
+/clear_queue - Очистить очередь
+
+Доступные стили: {', '.join(Config.AVAILABLE_STYLES)}
+Доступные длины: short (1000), medium (2000), long (3000)
+"""
+
+    # Текст главного меню настроек (подставляются только текущие значения)
+    SETTINGS_MENU_TEMPLATE = """
+⚙️ <b>Настройки бота</b>
+
+Текущие параметры:
+• Стиль написания: <code>{style}</code>
+• Длина текста: <code>{length}</code> ({chars} символов)
+• Мониторинг с: <code>{monitor_date}</code>
+
+Нажмите на кнопку для изменения настройки.
+"""
+
     def __init__(self, database: Optional[NewsDatabase] = None):
         self.bot_token = Config.TELEGRAM_BOT_TOKEN
         self.source_channel = Config.SOURCE_CHANNEL_ID
         self.target_channel = Config.TARGET_CHANNEL_ID
-        self.bot = telebot.TeleBot(self.bot_token, parse_mode='HTML')
+        # SOURCE_CHANNEL_ID - числовой ID канала или @username; разбираем один раз,
+        # чтобы сравнивать напрямую с message.chat.id / message.chat.username
+        self._source_chat_id, self._source_username = self._parse_channel_id(self.source_channel)
+        self._setup_api_session()
+        self.bot = telebot.TeleBot(self.bot_token, parse_mode='HTML', num_threads=HANDLER_WORKERS)
         # Используем переданную БД или создаем новую
         self.db = database if database else NewsDatabase()
         self.scheduler = PublicationScheduler()
-        self.urgent_keywords = Config.get_urgent_keywords()
+        self._refresh_urgent_keywords()
 
         # Определяем время начала мониторинга
-        monitor_from_date_str = Config.get_monitor_from_date()
-        if monitor_from_date_str and monitor_from_date_str.strip():
+        monitor_from_date_str = (Config.get_monitor_from_date() or '').strip()
+        if monitor_from_date_str:
             try:
-                # Парсим дату из настроек
-                self.bot_start_time = datetime.strptime(monitor_from_date_str, '%Y-%m-%d %H:%M:%S')
-                # Добавляем timezone info
-                self.bot_start_time = self.bot_start_time.replace(tzinfo=timezone.utc)
-                logger.info(f"Дата мониторинга установлена из конфигурации: {self.bot_start_time}")
+                # Парсим дату из настроек (формат YYYY-MM-DD HH:MM:SS - подмножество ISO 8601)
+                self.bot_start_time = datetime.fromisoformat(monitor_from_date_str)
+                # Дата без часового пояса считается UTC
+                if self.bot_start_time.tzinfo is None:
+                    self.bot_start_time = self.bot_start_time.replace(tzinfo=timezone.utc)
+                logger.info("Дата мониторинга установлена из конфигурации: %s", self.bot_start_time)
             except ValueError as e:
-                logger.warning(f"Неверный формат даты в MONITOR_FROM_DATE: {monitor_from_date_str}. Используется время запуска бота. Ошибка: {e}")
+                logger.warning("Неверный формат даты в MONITOR_FROM_DATE: %s. Используется время запуска бота. Ошибка: %s", monitor_from_date_str, e)
                 self.bot_start_time = datetime.now(timezone.utc)
         else:
             # Время запуска бота для фильтрации старых сообщений (если дата не указана)
             self.bot_start_time = datetime.now(timezone.utc)
 
-        logger.info(f"Бот запущен. Будут обрабатываться только сообщения после {self.bot_start_time}")
+        # Unix-время начала мониторинга для быстрого сравнения с message.date
+        self._bot_start_ts = self.bot_start_time.timestamp()
+
+        logger.info("Бот запущен. Будут обрабатываться только сообщения после %s", self.bot_start_time)
+
+        # ID администратора (ADMIN_USER_ID задается только в .env и не меняется в runtime).
+        # Храним как int, чтобы сравнивать напрямую с from_user.id; None - администратор не задан
+        admin_user_id = (Config.ADMIN_USER_ID or '').strip()
+        try:
+            self._admin_id = int(admin_user_id) if admin_user_id else None
+        except ValueError:
+            logger.warning("Некорректный ADMIN_USER_ID: %s - команды управления недоступны никому!", admin_user_id)
+            # ID пользователей Telegram положительные, поэтому 0 не совпадает ни с одним пользователем
+            self._admin_id = 0
+        if self._admin_id is None:
+            logger.warning("ADMIN_USER_ID не установлен в конфиге - команды управления доступны всем!")
 
         # Инициализация DeepSeek клиента с текущим стилем
-        from deepseek_client import DeepSeekClient
         self.deepseek = DeepSeekClient()
-        logger.info(f"DeepSeek инициализирован со стилем: {self.deepseek.get_style()}")
+        logger.info("DeepSeek инициализирован со стилем: %s", self.deepseek.get_style())
+
+        # URL, которые сейчас обрабатываются (защита от повторной обработки при репостах)
+        self._urls_in_progress = set()
+        self._urls_lock = threading.Lock()
+
+        # Недавно сохраненные в БД URL (LRU), чтобы репосты отсекались до загрузки и DeepSeek
+        self._known_urls = OrderedDict()
+
+        # Недавно прочитанные новости (LRU с TTL): news_id -> (время истечения, строка news_queue).
+        # Просмотр, меню переписывания и подтверждения обращаются к одной новости подряд
+        self._news_cache = OrderedDict()
+        self._news_cache_lock = threading.Lock()
+        # Счетчик сбросов кэша: строка, прочитанная из БД до сброса, в кэш не сохраняется
+        self._news_cache_generation = 0
+
+        # Выбор слота и запись в БД выполняются атомарно, чтобы параллельные
+        # сообщения не заняли один и тот же слот
+        self._schedule_lock = threading.Lock()
+
+        # Постоянный пул потоков для обработки сообщений канала (вместо потока на каждое сообщение)
+        self._url_executor = ThreadPoolExecutor(max_workers=MESSAGE_WORKERS, thread_name_prefix='url-proc')
+
+        # Общий пул загрузки статей для всех сообщений (ограничивает число одновременных
+        # запросов к новостным сайтам и не создает потоки на каждое сообщение)
+        self._fetch_executor = ThreadPoolExecutor(max_workers=URL_FETCH_WORKERS, thread_name_prefix='url-fetch')
+
+        # Отправки в канал (срочные и по расписанию) выполняются по одной
+        self._send_lock = threading.Lock()
+
+        # Отправка срочных публикаций в канал; один поток сохраняет порядок публикаций
+        self._publish_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='publish')
+
+        # Переписывание статей через DeepSeek (долгие запросы не занимают потоки обработчиков)
+        self._rewrite_executor = ThreadPoolExecutor(max_workers=REWRITE_WORKERS, thread_name_prefix='rewrite')
+
+        # Ответы на callback запросы отправляются параллельно с редактированием меню,
+        # чтобы индикатор загрузки на кнопке снимался не дожидаясь edit_message_text
+        self._callback_answer_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cb-answer')
+
+        # Сообщения об ошибках операций редактируются в фоне; один поток, чтобы
+        # ожидание flood control не занимало другие пулы
+        self._error_report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='error-report')
+
+        # Парсер статей создается один раз, чтобы переиспользовать HTTP-соединения
+        self.parser = NewsParser()
+
+        # Кэш главного меню настроек: (значения настроек, (текст, клавиатура))
+        self._settings_menu_cache = None
+
+        # Последнее содержимое сообщений с меню настроек (LRU): (chat_id, message_id) -> хэш
+        self._menu_edit_cache = OrderedDict()
+        self._menu_edit_lock = threading.Lock()
+
+        # Время последней правки сообщений о ходе операций (LRU): (chat_id, message_id) -> monotonic
+        self._last_edit_ts = OrderedDict()
+        self._last_edit_lock = threading.Lock()
+
+        # Выполняющиеся подтвержденные действия: (user_id, действие, news_id).
+        # Повторное нажатие той же кнопки до завершения действия игнорируется
+        self._inflight = set()
+        self._inflight_lock = threading.Lock()
+
+        # Клавиатуры выбора стиля/длины меняются только отметкой ✓,
+        # поэтому собираем их заранее для каждого выбранного значения
+        self._style_keyboards = {
+            key: self._build_choice_keyboard(self.STYLE_NAMES, "style_", key)
+            for key in self.STYLE_NAMES
+        }
+        self._length_keyboards = {
+            key: self._build_choice_keyboard(self.LENGTH_NAMES, "length_", key)
+            for key in self.LENGTH_NAMES
+        }
+        # Неизменяемые клавиатуры команд /start, /help, /status и /config
+        self._start_keyboard = types.InlineKeyboardMarkup(row_width=2)
+        self._start_keyboard.add(
+            types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status"),
+            types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue"),
+            types.InlineKeyboardButton("❓ Помощь", callback_data="cmd_help"),
+            types.InlineKeyboardButton("⚙️ Настройки", callback_data="cmd_settings")
+        )
+
+        self._help_keyboard = types.InlineKeyboardMarkup(row_width=2)
+        self._help_keyboard.add(
+            types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status"),
+            types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue"),
+            types.InlineKeyboardButton("⚙️ Настройки", callback_data="cmd_settings"),
+            types.InlineKeyboardButton("📝 Текущий стиль", callback_data="cmd_get_style")
+        )
+
+        self._status_keyboard = types.InlineKeyboardMarkup(row_width=2)
+        self._status_keyboard.add(
+            types.InlineKeyboardButton("🔄 Обновить", callback_data="cmd_status"),
+            types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue"),
+            types.InlineKeyboardButton("⚙️ Настройки", callback_data="cmd_settings")
+        )
+
+        self._config_keyboard = types.InlineKeyboardMarkup(row_width=1)
+        self._config_keyboard.add(
+            types.InlineKeyboardButton("📝 Изменить стиль написания", callback_data="settings_style"),
+            types.InlineKeyboardButton("📏 Изменить длину текста", callback_data="settings_length"),
+            types.InlineKeyboardButton("🔄 Перезагрузить настройки", callback_data="cmd_reload_config"),
+            types.InlineKeyboardButton("⚙️ Интерактивные настройки", callback_data="cmd_settings")
+        )
+
+        # Пустая очередь (/queue и навигация по страницам)
+        self._empty_queue_keyboard = types.InlineKeyboardMarkup(row_width=2)
+        self._empty_queue_keyboard.add(
+            types.InlineKeyboardButton("🔄 Обновить", callback_data="cmd_queue"),
+            types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status")
+        )
+
+        # Подтверждение /clear_queue
+        self._clear_queue_confirm_keyboard = types.InlineKeyboardMarkup(row_width=2)
+        self._clear_queue_confirm_keyboard.add(
+            types.InlineKeyboardButton("✅ Да, очистить", callback_data="clear_queue_execute"),
+            types.InlineKeyboardButton("❌ Отмена", callback_data="clear_queue_cancel")
+        )
+
+        # Экран даты мониторинга содержит только кнопку "Назад"
+        self._back_to_settings_keyboard = types.InlineKeyboardMarkup(row_width=1)
+        self._back_to_settings_keyboard.add(_BACK_TO_SETTINGS_BUTTON)
+        # Для /set_style (новое сообщение, без кнопки "Назад")
+        self._set_style_keyboards = {
+            key: self._build_choice_keyboard(self.STYLE_NAMES, "style_", key, with_back=False)
+            for key in self.STYLE_NAMES
+        }
 
         # Настройка обработчиков
+        self._setup_callback_routes()
         self._setup_handlers()
 
+    @staticmethod
+    def _parse_channel_id(channel: Optional[str]) -> tuple:
+        """
+        Разбор идентификатора канала из конфигурации
+
+        Returns:
+            tuple: (числовой ID или None, username без @ или None)
+        """
+        channel = (channel or '').strip()
+        if channel.lstrip('-').isdigit():
+            return int(channel), None
+        if channel.startswith('@'):
+            return None, channel[1:]
+        return None, None
+
+    @staticmethod
+    def _setup_api_session():
+        """
+        Общая HTTP-сессия для запросов к Telegram API
+
+        По умолчанию telebot создает отдельную сессию в каждом потоке, поэтому потоки
+        обработчиков, пула ссылок и планировщика не переиспользуют соединения друг друга.
+        Общая сессия с пулом keep-alive соединений избавляет от лишних TLS-рукопожатий.
+        Сжатие ответов (gzip, deflate) requests включает по умолчанию.
+        Повторяются только неудачные подключения: запрос до Telegram не дошел,
+        поэтому повтор не может продублировать сообщение.
+        """
+        session = requests.Session()
+        retries = Retry(total=2, read=0, status=0, other=0, backoff_factor=0.1)
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=TELEGRAM_POOL_SIZE,
+                                              max_retries=retries))
+        apihelper.session = session
+
+    def _setup_callback_routes(self):
+        """Таблицы маршрутизации callback запросов от inline кнопок (строятся один раз)"""
+        # Команды навигации (доступны всем)
+        self._cb_commands = {
+            "cmd_status": self._cmd_status,
+            "cmd_queue": self._cmd_queue,
+            "cmd_help": self._cmd_help,
+            "cmd_settings": self._cmd_settings,
+            "cmd_get_style": self._cmd_get_style,
+            "cmd_reload_config": self._cmd_reload_config,
+        }
+
+        # Точные совпадения callback_data
+        self._cb_exact = {
+            "publish_cancel": lambda call: self._handle_cancel_callback(call, "Публикация отменена"),
+            "delete_cancel": lambda call: self._handle_cancel_callback(call, "Удаление отменено"),
+            "clear_queue_execute": self._execute_clear_queue,
+            "clear_queue_cancel": lambda call: self._handle_cancel_callback(call, "Очистка очереди отменена"),
+            "settings_style": self._show_style_keyboard,
+            "settings_length": self._show_length_keyboard,
+            "settings_date": self._show_date_settings,
+            "back_to_settings": self._show_settings_menu,
+        }
+
+        # Префиксы, за которыми следует ID (обработчик получает call и int)
+        self._cb_id_prefixes = (
+            ("queue_page:", self._handle_queue_page_callback),
+            ("view_", self._handle_view_callback),
+            ("publish_confirm_", self._show_publish_confirmation),
+            ("publish_execute_", self._execute_publish),
+            ("delete_confirm_", self._show_delete_confirmation),
+            ("delete_execute_", self._execute_delete),
+        )
+
+        # Префиксы, данные которых разбирает сам обработчик
+        self._cb_prefixes = (
+            ("style_", self._set_style_from_callback),
+            ("length_", self._set_length_from_callback),
+            ("rewrite_", self._handle_rewrite_callback),
+        )
+
     def _setup_handlers(self):
         """Настройка обработчиков сообщений и команд"""
 
@@ -142,33 +578,32 @@ class TelegramHandler:
                 return
 
             # Проверяем, что сообщение из нужного канала
-            chat_id = str(message.chat.id)
-            chat_username = f"@{message.chat.username}" if message.chat.username else None
-
-            if chat_id != self.source_channel and chat_username != self.source_channel:
+            chat = message.chat
+            if chat.id != self._source_chat_id and (
+                    self._source_username is None or chat.username != self._source_username):
                 return
 
             # Фильтруем старые сообщения - обрабатываем только новые с момента запуска бота
-            message_date = datetime.fromtimestamp(message.date, tz=timezone.utc)
-            if message_date < self.bot_start_time:
-                logger.debug(f"Пропускаем старое сообщение от {message_date}")
+            if message.date < self._bot_start_ts:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Пропускаем старое сообщение от %s",
+                                 datetime.fromtimestamp(message.date, tz=timezone.utc))
                 return
 
-            logger.info(f"Получено новое сообщение из канала: {message.text[:100]}")
+            logger.info("Получено новое сообщение из канала: %s", message.text[:100])
 
             # Извлекаем ссылки из сообщения
             urls = self.extract_urls(message.text)
 
             if urls:
-                logger.info(f"Найдено {len(urls)} ссылок: {urls}")
-                # Обработка URL в отдельном потоке чтобы не блокировать бота
-                thread = threading.Thread(target=self._process_urls, args=(urls, message.text))
-                thread.start()
+                logger.info("Найдено %s ссылок: %s", len(urls), urls)
+                # Обработка URL в пуле потоков чтобы не блокировать бота
+                self._url_executor.submit(self._process_urls, urls, message.text)
             else:
                 logger.info("В сообщении не найдено ссылок")
 
         except Exception as e:
-            logger.error(f"Ошибка при обработке сообщения из канала: {e}")
+            logger.error("Ошибка при обработке сообщения из канала: %s", e)
 
     @staticmethod
     def extract_urls(text: str) -> List[str]:
@@ -181,82 +616,201 @@ class TelegramHandler:
         Returns:
             Список найденных URL
         """
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, text)
-        return urls
+        return _URL_RE.findall(text)
+
+    def _refresh_urgent_keywords(self):
+        """Перечитать ключевые слова срочности из Config и пересобрать регулярное выражение для поиска"""
+        # Ключевые слова уже приведены к нижнему регистру в Config, храним неизменяемый кортеж
+        self.urgent_keywords = tuple(Config.get_urgent_keywords())
+        # Пустые ключевые слова отбрасываем - иначе любая новость считалась бы срочной
+        keywords = [re.escape(kw) for kw in self.urgent_keywords if kw]
+        self._urgent_re = re.compile('|'.join(keywords), re.IGNORECASE) if keywords else None
 
-    def is_urgent_news(self, text: str) -> bool:
+    def is_urgent_news(self, *texts: str) -> bool:
         """
         Проверка, является ли новость срочной
 
         Args:
-            text: Текст для проверки
+            texts: Фрагменты текста для проверки (проверяются по отдельности, без склейки)
 
         Returns:
             True если новость срочная
         """
-        text_lower = text.lower()
-        for keyword in self.urgent_keywords:
-            if keyword in text_lower:
-                logger.info(f"Обнаружено срочное ключевое слово: {keyword}")
+        if self._urgent_re is None:
+            return False
+
+        for text in texts:
+            if not text:
+                continue
+            # Один проход по тексту для всех ключевых слов, без копии text.lower()
+            match = self._urgent_re.search(text)
+            if match:
+                logger.info("Обнаружено срочное ключевое слово: %s", match.group(0).lower())
                 return True
         return False
 
+    def _parse_url(self, url: str) -> Optional[dict]:
+        """
+        Загрузка и валидация статьи (выполняется в пуле потоков)
+
+        Args:
+            url: URL статьи
+
+        Returns:
+            Данные статьи или None если статья не прошла валидацию
+        """
+        # Статья уже есть в БД - не тратим время на загрузку и запрос к DeepSeek
+        if self.db.url_exists(url):
+            logger.info("Статья уже есть в базе данных, пропускаем: %s", url)
+            self._remember_url(url)
+            return None
+
+        article_data = self.parser.parse_article(url)
+
+        if not article_data or not self.parser.validate_article(article_data):
+            logger.warning("Статья не прошла валидацию: %s", url)
+            return None
+
+        return article_data
+
     def _process_urls(self, urls: List[str], channel_message_text: str = ""):
         """
         Обработка найденных URL
 
+        Статьи скачиваются параллельно, а обработка через DeepSeek, выбор слота
+        и запись в БД выполняются по порядку ссылок в сообщении.
+
+        Args:
+            urls: Список URL для обработки
+            channel_message_text: Текст сообщения из канала (для проверки срочности)
+        """
+        # Забираем только те URL, которые не обрабатываются другим потоком
+        # и которые не были недавно сохранены в БД
+        with self._urls_lock:
+            urls = [
+                url for url in dict.fromkeys(urls[:Config.MAX_ARTICLES_PER_RUN])
+                if url not in self._urls_in_progress and url not in self._known_urls
+            ]
+            self._urls_in_progress.update(urls)
+
+        if not urls:
+            return
+
+        try:
+            self._process_claimed_urls(urls, channel_message_text)
+        finally:
+            with self._urls_lock:
+                self._urls_in_progress.difference_update(urls)
+
+    def _remember_url(self, url: str):
+        """Запомнить URL, уже сохраненный в БД (повторные ссылки отсекаются без запроса к БД)"""
+        with self._urls_lock:
+            self._known_urls[url] = None
+            self._known_urls.move_to_end(url)
+            if len(self._known_urls) > KNOWN_URLS_CACHE_SIZE:
+                self._known_urls.popitem(last=False)
+
+    def _get_news_cached(self, news_id: int) -> Optional[dict]:
+        """
+        Получить новость по ID через кэш (отсутствующие новости не кэшируются)
+
+        Args:
+            news_id: ID новости
+
+        Returns:
+            Данные новости или None
+        """
+        now = time.monotonic()
+        with self._news_cache_lock:
+            entry = self._news_cache.get(news_id)
+            if entry and entry[0] > now:
+                self._news_cache.move_to_end(news_id)
+                return entry[1]
+            generation = self._news_cache_generation
+
+        news = self.db.get_news_by_id(news_id)
+        if news:
+            with self._news_cache_lock:
+                # Пока шло чтение, новость могла измениться (переписывание, публикация) -
+                # тогда прочитанная строка может быть устаревшей и не кэшируется
+                if generation != self._news_cache_generation:
+                    return news
+                self._news_cache[news_id] = (now + NEWS_CACHE_TTL, news)
+                self._news_cache.move_to_end(news_id)
+                if len(self._news_cache) > NEWS_CACHE_SIZE:
+                    self._news_cache.popitem(last=False)
+        return news
+
+    def _invalidate_news(self, news_id: Optional[int] = None):
+        """Сбросить кэш новости после изменения в БД (без ID - сбросить весь кэш)"""
+        with self._news_cache_lock:
+            self._news_cache_generation += 1
+            if news_id is None:
+                self._news_cache.clear()
+            else:
+                self._news_cache.pop(news_id, None)
+
+    def _process_claimed_urls(self, urls: List[str], channel_message_text: str):
+        """
+        Загрузка, обработка и постановка в очередь статей по списку URL
+
         Args:
             urls: Список URL для обработки
             channel_message_text: Текст сообщения из канала (для проверки срочности)
         """
-        from news_parser import NewsParser
+        # Текст сообщения общий для всех ссылок - проверяем его на срочность один раз
+        message_is_urgent = self.is_urgent_news(channel_message_text)
 
-        parser = NewsParser()
+        # Загрузка статей идет в общем пуле, результаты обрабатываются в порядке ссылок
+        futures = [(url, self._fetch_executor.submit(self._parse_url, url)) for url in urls]
 
-        for url in urls[:Config.MAX_ARTICLES_PER_RUN]:
+        for url, future in futures:
             try:
                 # Парсинг статьи
-                article_data = parser.parse_article(url)
+                article_data = future.result()
 
-                if not article_data or not parser.validate_article(article_data):
-                    logger.warning(f"Статья не прошла валидацию: {url}")
+                if not article_data:
                     continue
 
                 # Проверка срочности - сначала в тексте сообщения канала, затем в содержимом статьи
-                is_urgent = self.is_urgent_news(channel_message_text) or \
-                           self.is_urgent_news(article_data.get('title', '') + ' ' + article_data.get('text', ''))
+                is_urgent = message_is_urgent or self.is_urgent_news(
+                    article_data.get('title', ''),
+                    article_data.get('text', '')
+                )
 
                 # Обработка через DeepSeek с текущим стилем
                 processed_text = self.deepseek.process_article(article_data)
 
                 if processed_text:
-                    # Определение времени публикации
-                    scheduled_time = self.scheduler.get_next_available_slot(is_urgent=is_urgent, db=self.db)
-
-                    # Добавление в очередь
-                    news_id = self.db.add_news(
-                        url=url,
-                        title=article_data.get('title', ''),
-                        original_text=article_data.get('text', ''),
-                        processed_text=processed_text,
-                        scheduled_time=scheduled_time,
-                        is_urgent=is_urgent
-                    )
+                    with self._schedule_lock:
+                        # Определение времени публикации
+                        scheduled_time = self.scheduler.get_next_available_slot(is_urgent=is_urgent, db=self.db)
+
+                        # Добавление в очередь
+                        news_id = self.db.add_news(
+                            url=url,
+                            title=article_data.get('title', ''),
+                            original_text=article_data.get('text', ''),
+                            processed_text=processed_text,
+                            scheduled_time=scheduled_time,
+                            is_urgent=is_urgent
+                        )
 
                     if news_id:
+                        self._remember_url(url)
                         if is_urgent:
-                            # Срочные новости публикуем немедленно
-                            logger.info(f"Срочная новость! Публикуем немедленно: {article_data.get('title')}")
-                            self.publish_news_by_id(news_id)
+                            # Срочные новости публикуем немедленно, не дожидаясь ответа Telegram
+                            # перед обработкой следующей статьи из сообщения
+                            logger.info("Срочная новость! Публикуем немедленно: %s", article_data.get('title'))
+                            self._publish_executor.submit(self.publish_news_by_id, news_id)
                         else:
                             madrid_time = to_madrid_tz(scheduled_time)
-                            logger.info(f"Новость добавлена в очередь. Публикация: {madrid_time.strftime('%Y-%m-%d %H:%M %Z')}")
+                            logger.info("Новость добавлена в очередь. Публикация: %s", madrid_time.strftime('%Y-%m-%d %H:%M %Z'))
                 else:
-                    logger.error(f"Не удалось обработать статью: {url}")
+                    logger.error("Не удалось обработать статью: %s", url)
 
             except Exception as e:
-                logger.error(f"Ошибка при обработке URL {url}: {e}")
+                logger.error("Ошибка при обработке URL %s: %s", url, e)
 
     def publish_news_by_id(self, news_id: int) -> bool:
         """
@@ -269,42 +823,84 @@ class TelegramHandler:
             True если успешно
         """
         try:
-            logger.info(f"Начинаем публикацию новости ID {news_id}")
+            logger.info("Начинаем публикацию новости ID %s", news_id)
 
             news = self.db.get_news_by_id(news_id)
             if not news:
-                logger.error(f"Новость с ID {news_id} не найдена в базе данных")
+                logger.error("Новость с ID %s не найдена в базе данных", news_id)
                 return False
 
-            logger.info(f"Новость найдена: {news.get('title')[:50]}...")
-            logger.info(f"Целевой канал: {self.target_channel}")
+        except Exception as e:
+            logger.error("❌ Ошибка при получении новости %s из БД: %s", news_id, e, exc_info=True)
+            return False
+
+        return self._publish_news(news)
+
+    def _publish_news(self, news: dict) -> bool:
+        """
+        Публикация уже загруженной из БД новости
+
+        Args:
+            news: Данные новости из БД (строка news_queue)
+
+        Returns:
+            True если успешно
+        """
+        news_id = news['id']
+        try:
+            logger.info("Новость найдена: %s...", news.get('title')[:50])
+            logger.info("Целевой канал: %s", self.target_channel)
 
             # Формирование финального текста
             final_text = self._format_for_telegram_from_db(news)
-            logger.info(f"Текст отформатирован, длина: {len(final_text)} символов")
+            logger.info("Текст отформатирован, длина: %s символов", len(final_text))
 
             # Отправка в целевой канал
-            logger.info(f"Отправляем сообщение в канал {self.target_channel}")
-            self.bot.send_message(
-                chat_id=self.target_channel,
-                text=final_text,
-                parse_mode='HTML',
-                disable_web_page_preview=False
-            )
+            logger.info("Отправляем сообщение в канал %s", self.target_channel)
+            self._send_to_channel(final_text)
             logger.info("Сообщение успешно отправлено")
 
             # Отметить как опубликованную
             self.db.mark_as_published(news_id)
-            logger.info(f"Статус новости {news_id} обновлен на 'published'")
+            self._invalidate_news(news_id)
+            logger.info("Статус новости %s обновлен на 'published'", news_id)
 
-            logger.info(f"✅ Новость успешно опубликована: {news.get('title')}")
+            logger.info("✅ Новость успешно опубликована: %s", news.get('title'))
             return True
 
         except Exception as e:
-            logger.error(f"❌ Ошибка при публикации новости {news_id}: {e}", exc_info=True)
+            logger.error("❌ Ошибка при публикации новости %s: %s", news_id, e, exc_info=True)
             self.db.mark_as_failed(news_id)
+            self._invalidate_news(news_id)
             return False
 
+    def _send_to_channel(self, text: str):
+        """
+        Отправка сообщения в целевой канал с учетом flood control Telegram
+
+        При ответе 429 ждем указанное Telegram время (retry_after) и повторяем отправку.
+        Отправки публикаций сериализуются, чтобы срочные и плановые публикации
+        не превышали лимиты одновременно.
+
+        Args:
+            text: Текст сообщения (HTML)
+        """
+        with self._send_lock:
+            for attempt in range(FLOOD_RETRY_ATTEMPTS + 1):
+                try:
+                    return self.bot.send_message(
+                        chat_id=self.target_channel,
+                        text=text,
+                        parse_mode='HTML',
+                        disable_web_page_preview=False
+                    )
+                except apihelper.ApiTelegramException as e:
+                    if e.error_code != 429 or attempt == FLOOD_RETRY_ATTEMPTS:
+                        raise
+                    retry_after = (e.result_json.get('parameters') or {}).get('retry_after', 1)
+                    logger.warning("Flood control Telegram, повтор отправки через %s сек.", retry_after)
+                    time.sleep(retry_after)
+
     def publish_scheduled_news(self):
         """
         Публикация новостей по расписанию
@@ -314,11 +910,12 @@ class TelegramHandler:
             # Получаем новости готовые к публикации (по 1 на слот)
             news_list = self.db.get_news_for_publication(limit=1)
 
+            # Строки уже содержат все поля - повторно из БД не читаем
             for news in news_list:
-                self.publish_news_by_id(news['id'])
+                self._publish_news(news)
 
         except Exception as e:
-            logger.error(f"Ошибка при публикации по расписанию: {e}")
+            logger.error("Ошибка при публикации по расписанию: %s", e)
 
     @staticmethod
     def _format_for_telegram_from_db(news: dict) -> str:
@@ -332,32 +929,17 @@ class TelegramHandler:
         Returns:
             Отформатированный текст для HTML parse mode
         """
-        import html
-
         processed_text = news.get('processed_text', '')
         url = news.get('url', '')
 
-        # Разбиваем текст на строки
-        lines = processed_text.split('\n')
-
-        # Первая непустая строка - это заголовок
-        title_line = ''
-        body_lines = []
-        title_found = False
-
-        for line in lines:
-            if not title_found and line.strip():
-                # Это заголовок
-                title_line = line.strip()
-                title_found = True
-            elif title_found:
-                # Все после заголовка
-                body_lines.append(line)
+        # Экранируем HTML символы один раз для всего текста
+        # (экранирование не затрагивает пробелы и переводы строк, поэтому разбиение ниже не меняется)
+        text_escaped = html.escape(processed_text.lstrip())
 
-        # Экранируем HTML символы в заголовке и тексте
-        title_escaped = html.escape(title_line)
-        body_text = '\n'.join(body_lines).strip()
-        body_escaped = html.escape(body_text)
+        # Первая непустая строка - это заголовок, все после нее - основной текст
+        title_escaped, _, body_escaped = text_escaped.partition('\n')
+        title_escaped = title_escaped.strip()
+        body_escaped = body_escaped.strip()
 
         # Форматируем заголовок жирным
         formatted_title = f"<b>{title_escaped}</b>" if title_escaped else ""
@@ -371,34 +953,33 @@ class TelegramHandler:
             final_text = body_escaped
 
         # Добавляем подпись канала и ссылку на источник (HTML формат)
-        footer = f'\n\nКанал: @iberia_news\n<a href="{url}">Источник</a>'
+        # URL экранируем, чтобы кавычки и & не ломали атрибут href
+        url_escaped = html.escape(url, quote=True)
 
         # Telegram имеет лимит в 4096 символов
-        max_length = 4096 - len(footer) - 100  # запас
+        max_length = _TEXT_LENGTH_BUDGET - len(url_escaped)
 
         if len(final_text) > max_length:
-            final_text = final_text[:max_length] + "..."
+            truncated = final_text[:max_length]
+            # Не обрываем текст посередине HTML-сущности (&amp; и т.п.) - Telegram не примет такой HTML
+            amp_pos = truncated.rfind('&', max_length - _MAX_HTML_ENTITY_LENGTH)
+            if amp_pos != -1 and ';' not in truncated[amp_pos:]:
+                truncated = truncated[:amp_pos]
+            final_text = f"{truncated}..."
 
-        return final_text + footer
+        return f"{final_text}{_FOOTER_PREFIX}{url_escaped}{_FOOTER_SUFFIX}"
 
 
     # Команды управления ботом
 
+    def _is_admin(self, user_id: int) -> bool:
+        """Проверка, что пользователь - администратор (если администратор не задан, доступно всем)"""
+        return self._admin_id is None or user_id == self._admin_id
+
     def _cmd_start(self, message: types.Message):
         """Команда /start"""
         start_time_str = self.bot_start_time.strftime('%Y-%m-%d %H:%M:%S UTC')
 
-        # Создаем inline клавиатуру
-        keyboard = types.InlineKeyboardMarkup(row_width=2)
-        keyboard.add(
-            types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status"),
-            types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue")
-        )
-        keyboard.add(
-            types.InlineKeyboardButton("❓ Помощь", callback_data="cmd_help"),
-            types.InlineKeyboardButton("⚙️ Настройки", callback_data="cmd_settings")
-        )
-
         self.bot.reply_to(
             message,
             "Бот автоматической публикации новостей запущен!\n\n"
@@ -407,58 +988,20 @@ class TelegramHandler:
             f"{self.scheduler.format_schedule()}\n\n"
             "Выберите действие:",
             parse_mode=None,
-            reply_markup=keyboard
+            reply_markup=self._start_keyboard
         )
 
     def _cmd_help(self, message: types.Message):
         """Команда /help"""
-        available_styles = ', '.join(Config.AVAILABLE_STYLES)
-        help_text = f"""
-Доступные команды:
-
-📋 Основные:
-/start - Информация о боте
-/status - Статус очереди новостей
-/queue - Показать новости в очереди
-/help - Это сообщение
-
-⚙️ Настройки (админ):
-/settings - Интерактивное меню настроек (кнопки)
-/set_style [style] - Изменить стиль написания
-/get_style - Показать текущий стиль
-/config - Показать все настройки
-/set_config [key] [value] - Изменить настройку
-/reload_config - Перезагрузить настройки
-
-📰 Публикации (админ):
-/view [id] - Просмотр публикации по ID
-/rewrite [id] - Переписать статью с новым стилем/длиной
-/publishnow [id] - Опубликовать немедленно
-/clear_queue - Очистить очередь
-
-Доступные стили: {available_styles}
-Доступные длины: short (1000), medium (2000), long (3000)
-"""
-        # Создаем inline клавиатуру
-        keyboard = types.InlineKeyboardMarkup(row_width=2)
-        keyboard.add(
-            types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status"),
-            types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue")
-        )
-        keyboard.add(
-            types.InlineKeyboardButton("⚙️ Настройки", callback_data="cmd_settings"),
-            types.InlineKeyboardButton("📝 Текущий стиль", callback_data="cmd_get_style")
-        )
-
         # Отправляем без HTML парсинга, так как это обычный текст
-        self.bot.reply_to(message, help_text, parse_mode=None, reply_markup=keyboard)
+        self.bot.reply_to(message, self.HELP_TEXT, parse_mode=None, reply_markup=self._help_keyboard)
 
+    @command_errors("/status", "Ошибка при получении статуса")
     def _cmd_status(self, message: types.Message):
         """Команда /status"""
-        try:
-            stats = self.db.get_queue_status()
+        stats = self.db.get_queue_status()
 
-            status_text = f"""
+        status_text = f"""
 📊 Статус очереди новостей:
 
 Всего новостей: {stats.get('total', 0)}
@@ -472,28 +1015,15 @@ class TelegramHandler:
 Следующая публикация: {self.scheduler.get_next_publication_time().strftime('%Y-%m-%d %H:%M')}
 """
 
-            if stats.get('next_news'):
-                status_text += "\n\n📰 Следующие новости:\n"
-                for news in stats['next_news']:
-                    urgent_mark = "🔥 " if news['is_urgent'] else ""
-                    madrid_time = to_madrid_tz(news['scheduled_time']).strftime('%Y-%m-%d %H:%M')
-                    status_text += f"{urgent_mark}{news['id']}. {news['title'][:50]}... ({madrid_time})\n"
-
-            # Создаем inline клавиатуру
-            keyboard = types.InlineKeyboardMarkup(row_width=2)
-            keyboard.add(
-                types.InlineKeyboardButton("🔄 Обновить", callback_data="cmd_status"),
-                types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue")
-            )
-            keyboard.add(
-                types.InlineKeyboardButton("⚙️ Настройки", callback_data="cmd_settings")
-            )
-
-            self.bot.reply_to(message, status_text, parse_mode=None, reply_markup=keyboard)
+        if stats.get('next_news'):
+            parts = [status_text, "\n\n📰 Следующие новости:\n"]
+            for news in stats['next_news']:
+                urgent_mark = "🔥 " if news['is_urgent'] else ""
+                madrid_time = to_madrid_tz(news['scheduled_time']).strftime('%Y-%m-%d %H:%M')
+                parts.append(f"{urgent_mark}{news['id']}. {news['title'][:50]}... ({madrid_time})\n")
+            status_text = ''.join(parts)
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /status: {e}")
-            self.bot.reply_to(message, "Ошибка при получении статуса")
+        self.bot.reply_to(message, status_text, parse_mode=None, reply_markup=self._status_keyboard)
 
     def _get_queue_page(self, page: int = 0):
         """
@@ -505,14 +1035,14 @@ class TelegramHandler:
         Returns:
             tuple: (queue_text, keyboard) или (None, None) если нет новостей
         """
-        news_list = self.db.get_pending_news()
+        # Из БД читаем только количество и строки текущей страницы
+        total_items = self.db.get_pending_count()
 
-        if not news_list:
+        if not total_items:
             return None, None
 
         # Параметры пагинации
         items_per_page = 5
-        total_items = len(news_list)
         total_pages = (total_items + items_per_page - 1) // items_per_page  # Округление вверх
 
         # Проверка корректности номера страницы
@@ -521,37 +1051,47 @@ class TelegramHandler:
         elif page >= total_pages:
             page = total_pages - 1
 
-        # Вычисляем индексы для текущей страницы
+        # Загружаем новости текущей страницы
         start_idx = page * items_per_page
-        end_idx = min(start_idx + items_per_page, total_items)
+        page_news = self.db.get_pending_news(limit=items_per_page, offset=start_idx)
 
         # Формируем текст
-        queue_text = f"📋 Новости в очереди: {total_items}\n"
-        queue_text += f"📄 Страница {page + 1} из {total_pages}\n\n"
+        parts = [
+            f"📋 Новости в очереди: {total_items}\n"
+            f"📄 Страница {page + 1} из {total_pages}\n\n"
+        ]
 
         # Добавляем новости текущей страницы
-        for idx, news in enumerate(news_list[start_idx:end_idx], start=start_idx + 1):
+        for idx, news in enumerate(page_news, start=start_idx + 1):
             urgent_mark = "🔥 " if news['is_urgent'] else ""
             madrid_time = to_madrid_tz(news['scheduled_time']).strftime('%Y-%m-%d %H:%M')
-            queue_text += f"{idx}. {urgent_mark}ID {news['id']}: {news['title'][:60]}...\n"
-            queue_text += f"   ⏰ {madrid_time}\n"
-            queue_text += f"   🔗 {news['url'][:50]}...\n\n"
+            parts.append(
+                f"{idx}. {urgent_mark}ID {news['id']}: {news['title'][:60]}...\n"
+                f"   ⏰ {madrid_time}\n"
+                f"   🔗 {news['url'][:50]}...\n\n"
+            )
+
+        queue_text = ''.join(parts)
 
         # Создаем inline клавиатуру
         keyboard = types.InlineKeyboardMarkup(row_width=2)
 
-        # Добавляем кнопки для каждой новости на странице
-        for news in news_list[start_idx:end_idx]:
-            keyboard.add(
+        # Добавляем кнопки для каждой новости на странице (по две в ряд)
+        news_buttons = []
+        for news in page_news:
+            news_buttons.append(
                 types.InlineKeyboardButton(
                     f"👁️ Просмотр #{news['id']}",
                     callback_data=f"view_{news['id']}"
-                ),
+                )
+            )
+            news_buttons.append(
                 types.InlineKeyboardButton(
                     f"🚀 Опубликовать #{news['id']}",
                     callback_data=f"publish_confirm_{news['id']}"
                 )
             )
+        keyboard.add(*news_buttons)
 
         # Добавляем кнопки навигации
         nav_buttons = []
@@ -577,46 +1117,22 @@ class TelegramHandler:
 
         return queue_text, keyboard
 
+    @command_errors("/queue", "Ошибка при получении очереди")
     def _cmd_queue(self, message: types.Message):
         """Команда /queue"""
-        try:
-            queue_text, keyboard = self._get_queue_page(page=0)
-
-            if queue_text is None:
-                keyboard = types.InlineKeyboardMarkup(row_width=2)
-                keyboard.add(
-                    types.InlineKeyboardButton("🔄 Обновить", callback_data="cmd_queue"),
-                    types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status")
-                )
-                self.bot.reply_to(message, "Очередь пуста", reply_markup=keyboard)
-                return
+        queue_text, keyboard = self._get_queue_page(page=0)
 
-            self.bot.reply_to(message, queue_text, parse_mode=None, reply_markup=keyboard)
+        if queue_text is None:
+            self.bot.reply_to(message, "Очередь пуста", reply_markup=self._empty_queue_keyboard)
+            return
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /queue: {e}")
-            self.bot.reply_to(message, "Ошибка при получении очереди")
+        self.bot.reply_to(message, queue_text, parse_mode=None, reply_markup=keyboard)
 
+    @command_errors("/publish_now")
+    @require_admin("/publish_now")
     def _cmd_publish_now(self, message: types.Message):
         """Команда /publish_now <id> или /publishnow <id>"""
         try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /publishnow от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}. Требуется: {Config.ADMIN_USER_ID}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}\n"
-                        f"Требуется ID администратора (установите в .env файле ADMIN_USER_ID)"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
-
             # Извлекаем ID из команды
             parts = message.text.split()
             if len(parts) < 2:
@@ -624,218 +1140,110 @@ class TelegramHandler:
                 return
 
             news_id = int(parts[1])
-            logger.info(f"Запрос подтверждения публикации новости ID: {news_id}")
+            logger.info("Запрос подтверждения публикации новости ID: %s", news_id)
 
             # Получаем информацию о новости
-            news = self.db.get_news_by_id(news_id)
+            news = self._get_news_cached(news_id)
             if not news:
                 self.bot.reply_to(message, f"❌ Новость с ID {news_id} не найдена")
                 return
 
             # Создаем inline клавиатуру подтверждения
-            keyboard = types.InlineKeyboardMarkup(row_width=2)
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    "✅ Да, опубликовать",
-                    callback_data=f"publish_execute_{news_id}"
-                ),
-                types.InlineKeyboardButton(
-                    "❌ Отмена",
-                    callback_data="publish_cancel"
-                )
-            )
+            keyboard = self._publish_confirm_keyboard(news_id)
 
             self.bot.reply_to(
                 message,
-                f"🚀 **Подтверждение публикации**\n\n"
+                f"🚀 <b>Подтверждение публикации</b>\n\n"
                 f"Вы хотите опубликовать новость?\n\n"
-                f"**ID:** {news_id}\n"
-                f"**Заголовок:** {news.get('title', '')[:100]}...\n\n"
+                f"<b>ID:</b> {news_id}\n"
+                f"<b>Заголовок:</b> {html.escape(news.get('title', '')[:100])}...\n\n"
                 f"Подтвердите действие:",
-                parse_mode='Markdown',
+                parse_mode='HTML',
                 reply_markup=keyboard
             )
 
         except ValueError:
             self.bot.reply_to(message, "Неверный формат ID")
-        except Exception as e:
-            logger.error(f"Ошибка в команде /publish_now: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
 
+    @command_errors("/clear_queue")
+    @require_admin("/clear_queue")
     def _cmd_clear_queue(self, message: types.Message):
         """Команда /clear_queue"""
-        try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /clear_queue от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}. Требуется: {Config.ADMIN_USER_ID}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}\n"
-                        f"Требуется ID администратора"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
+        # Получаем количество новостей в очереди
+        stats = self.db.get_queue_status()
+        pending_count = stats.get('pending', 0)
 
-            # Получаем количество новостей в очереди
-            stats = self.db.get_queue_status()
-            pending_count = stats.get('pending', 0)
+        if pending_count == 0:
+            self.bot.reply_to(message, "Очередь уже пуста")
+            return
 
-            if pending_count == 0:
-                self.bot.reply_to(message, "Очередь уже пуста")
-                return
+        self.bot.reply_to(
+            message,
+            f"⚠️ <b>Подтверждение очистки очереди</b>\n\n"
+            f"Вы действительно хотите удалить <b>{pending_count}</b> новостей из очереди?\n\n"
+            f"Это действие нельзя отменить!",
+            parse_mode='HTML',
+            reply_markup=self._clear_queue_confirm_keyboard
+        )
 
-            # Создаем inline клавиатуру подтверждения
-            keyboard = types.InlineKeyboardMarkup(row_width=2)
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    "✅ Да, очистить",
-                    callback_data="clear_queue_execute"
-                ),
-                types.InlineKeyboardButton(
-                    "❌ Отмена",
-                    callback_data="clear_queue_cancel"
-                )
-            )
+    @command_errors("/set_style")
+    @require_admin("/set_style")
+    def _cmd_set_style(self, message: types.Message):
+        """Команда /set_style <style> или /setstyle <style>"""
+        # Извлекаем стиль из команды
+        parts = message.text.split()
+        if len(parts) < 2:
+            # Показываем меню с кнопками
+            current_style = self.deepseek.get_style()
 
             self.bot.reply_to(
                 message,
-                f"⚠️ **Подтверждение очистки очереди**\n\n"
-                f"Вы действительно хотите удалить **{pending_count}** новостей из очереди?\n\n"
-                f"Это действие нельзя отменить!",
-                parse_mode='Markdown',
-                reply_markup=keyboard
+                f"📝 <b>Изменить стиль написания</b>\n\n"
+                f"Текущий стиль: <b>{current_style}</b>\n\n"
+                f"Выберите новый стиль:",
+                parse_mode='HTML',
+                reply_markup=self._set_style_keyboards[current_style]
             )
+            return
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /clear_queue: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
-
-    def _cmd_set_style(self, message: types.Message):
-        """Команда /set_style <style> или /setstyle <style>"""
-        try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /set_style от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
-
-            # Извлекаем стиль из команды
-            parts = message.text.split()
-            if len(parts) < 2:
-                # Показываем меню с кнопками
-                current_style = self.deepseek.get_style()
-
-                keyboard = types.InlineKeyboardMarkup(row_width=1)
-
-                style_names = {
-                    'informative': '📰 Информативный',
-                    'ironic': '😏 Ироничный',
-                    'cynical': '😒 Циничный',
-                    'playful': '😄 Шутливый',
-                    'mocking': '🤣 Стебной'
-                }
-
-                for style_key, style_name in style_names.items():
-                    checkmark = " ✓" if style_key == current_style else ""
-                    keyboard.add(
-                        types.InlineKeyboardButton(
-                            f"{style_name}{checkmark}",
-                            callback_data=f"style_{style_key}"
-                        )
-                    )
-
-                self.bot.reply_to(
-                    message,
-                    f"📝 **Изменить стиль написания**\n\n"
-                    f"Текущий стиль: **{current_style}**\n\n"
-                    f"Выберите новый стиль:",
-                    parse_mode='Markdown',
-                    reply_markup=keyboard
-                )
-                return
-
-            new_style = parts[1].lower()
-
-            # Проверяем доступность стиля
-            if new_style not in Config.AVAILABLE_STYLES:
-                available_styles = '\n'.join([f"- {style}" for style in Config.AVAILABLE_STYLES])
-                self.bot.reply_to(
-                    message,
-                    f"❌ Неизвестный стиль: {new_style}\n\n"
-                    f"Доступные стили:\n{available_styles}",
-                    parse_mode=None
-                )
-                return
-
-            # Устанавливаем новый стиль
-            self.deepseek.set_style(new_style)
-            logger.info(f"Стиль изменен на: {new_style}")
+        new_style = parts[1].lower()
 
+        # Проверяем доступность стиля
+        if new_style not in Config.AVAILABLE_STYLES:
             self.bot.reply_to(
                 message,
-                f"✅ Стиль написания изменен на: {new_style}\n\n"
-                f"Все новые статьи будут обрабатываться в этом стиле.",
+                f"❌ Неизвестный стиль: {new_style}\n\n"
+                f"Доступные стили:\n{self.STYLES_LIST_TEXT}",
                 parse_mode=None
             )
+            return
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /set_style: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
+        # Устанавливаем новый стиль
+        self.deepseek.set_style(new_style)
+        logger.info("Стиль изменен на: %s", new_style)
+
+        self.bot.reply_to(
+            message,
+            f"✅ Стиль написания изменен на: {new_style}\n\n"
+            f"Все новые статьи будут обрабатываться в этом стиле.",
+            parse_mode=None
+        )
 
+    @command_errors("/get_style")
     def _cmd_get_style(self, message: types.Message):
         """Команда /get_style или /getstyle"""
-        try:
-            current_style = self.deepseek.get_style()
-            available_styles = '\n'.join([f"- {style}" for style in Config.AVAILABLE_STYLES])
-
-            # Создаем inline клавиатуру для быстрого изменения стиля
-            keyboard = types.InlineKeyboardMarkup(row_width=1)
-
-            style_names = {
-                'informative': '📰 Информативный',
-                'ironic': '😏 Ироничный',
-                'cynical': '😒 Циничный',
-                'playful': '😄 Шутливый',
-                'mocking': '🤣 Стебной'
-            }
-
-            for style_key, style_name in style_names.items():
-                checkmark = " ✓" if style_key == current_style else ""
-                keyboard.add(
-                    types.InlineKeyboardButton(
-                        f"{style_name}{checkmark}",
-                        callback_data=f"style_{style_key}"
-                    )
-                )
-
-            self.bot.reply_to(
-                message,
-                f"📝 Текущий стиль написания: **{current_style}**\n\n"
-                f"Выберите новый стиль:",
-                parse_mode='Markdown',
-                reply_markup=keyboard
-            )
+        current_style = self.deepseek.get_style()
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /get_style: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
+        # Inline клавиатура для быстрого изменения стиля (та же, что у /set_style)
+        self.bot.reply_to(
+            message,
+            f"📝 Текущий стиль написания: <b>{current_style}</b>\n\n"
+            f"Выберите новый стиль:",
+            parse_mode='HTML',
+            reply_markup=self._set_style_keyboards[current_style]
+        )
 
+    @command_errors("/view")
     def _cmd_view(self, message: types.Message):
         """Команда /view <id> - просмотр публикации по ID"""
         try:
@@ -846,75 +1254,21 @@ class TelegramHandler:
                 return
 
             news_id = int(parts[1])
-            logger.info(f"Запрос на просмотр публикации ID: {news_id}")
+            logger.info("Запрос на просмотр публикации ID: %s", news_id)
 
             # Получаем новость из БД
-            news = self.db.get_news_by_id(news_id)
+            news = self._get_news_cached(news_id)
             if not news:
                 self.bot.reply_to(message, f"❌ Публикация с ID {news_id} не найдена")
                 return
 
-            # Форматируем текст для отображения
-            final_text = self._format_for_telegram_from_db(news)
-
-            # Добавляем информацию о статусе
-            status_emoji = {
-                'pending': '⏳',
-                'published': '✅',
-                'failed': '❌'
-            }
-            status = news.get('status', 'unknown')
-            status_text = f"{status_emoji.get(status, '❓')} Статус: {status}\n"
-
-            # Форматируем scheduled_time с timezone Мадрида
-            scheduled_time = news.get('scheduled_time')
-            if scheduled_time:
-                madrid_time = to_madrid_tz(scheduled_time).strftime('%Y-%m-%d %H:%M')
-                scheduled_text = f"⏰ Запланировано: {madrid_time}\n"
-            else:
-                scheduled_text = "⏰ Запланировано: не указано\n"
-
-            # Форматируем updated_at если есть
-            updated_at = news.get('updated_at')
-            if updated_at:
-                madrid_updated = to_madrid_tz(updated_at).strftime('%Y-%m-%d %H:%M')
-                updated_text = f"✏️ Изменено: {madrid_updated}\n"
-            else:
-                updated_text = ""
-
-            info_text = f"ID: {news_id}\n{status_text}{scheduled_text}{updated_text}\n{'='*30}\n\n"
-
-            # Создаем inline клавиатуру с действиями
-            keyboard = types.InlineKeyboardMarkup(row_width=2)
-
-            # Если статья еще не опубликована, добавляем кнопки действий
-            if status == 'pending':
-                keyboard.add(
-                    types.InlineKeyboardButton(
-                        "🚀 Опубликовать",
-                        callback_data=f"publish_confirm_{news_id}"
-                    ),
-                    types.InlineKeyboardButton(
-                        "✏️ Переписать",
-                        callback_data=f"rewrite_{news_id}_select_both"
-                    )
-                )
-                keyboard.add(
-                    types.InlineKeyboardButton(
-                        "🗑️ Удалить",
-                        callback_data=f"delete_confirm_{news_id}"
-                    )
-                )
-
-            keyboard.add(
-                types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue"),
-                types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status")
-            )
+            # Текст превью и клавиатура действий
+            view_text, keyboard = self._build_news_view(news)
 
             # Отправляем превью публикации
             self.bot.reply_to(
                 message,
-                info_text + final_text,
+                view_text,
                 parse_mode='HTML',
                 disable_web_page_preview=False,
                 reply_markup=keyboard
@@ -922,91 +1276,133 @@ class TelegramHandler:
 
         except ValueError:
             self.bot.reply_to(message, "Неверный формат ID. Используйте: /view [id]", parse_mode=None)
-        except Exception as e:
-            logger.error(f"Ошибка в команде /view: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
 
-    def _cmd_config(self, message: types.Message):
-        """Команда /config - показать все настройки бота"""
-        try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /config от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
+    def _build_news_view(self, news: dict) -> tuple:
+        """
+        Собрать превью публикации для /view и кнопки просмотра
 
-            # Получаем все настройки из БД
-            all_configs = self.db.get_all_config()
+        Args:
+            news: Данные новости из БД
 
-            if not all_configs:
-                self.bot.reply_to(message, "⚠️ Нет настроек в базе данных", parse_mode=None)
-                return
+        Returns:
+            tuple: (текст превью, клавиатура действий)
+        """
+        news_id = news['id']
+        status = news.get('status', 'unknown')
+
+        # Время запланированной публикации и последнего изменения - по Мадриду
+        scheduled_time = news.get('scheduled_time')
+        scheduled = to_madrid_tz(scheduled_time).strftime('%Y-%m-%d %H:%M') if scheduled_time else "не указано"
+        updated_at = news.get('updated_at')
+        updated_text = f"✏️ Изменено: {to_madrid_tz(updated_at).strftime('%Y-%m-%d %H:%M')}\n" if updated_at else ""
+
+        view_text = (
+            f"ID: {news_id}\n"
+            f"{self.STATUS_EMOJI.get(status, '❓')} Статус: {status}\n"
+            f"⏰ Запланировано: {scheduled}\n"
+            f"{updated_text}\n{_VIEW_RULE}\n\n"
+            f"{self._format_for_telegram_from_db(news)}"
+        )
 
-            # Форматируем список настроек (используем HTML для более надежного парсинга)
-            config_text = "⚙️ <b>Настройки бота из базы данных:</b>\n\n"
-            for key, value in all_configs.items():
-                config_text += f"<b>{key}:</b> <code>{value}</code>\n"
+        return view_text, self._news_view_keyboard(news_id, status == 'pending')
 
-            config_text += "\nИспользуйте /set_config для изменения или выберите настройку из меню:"
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _news_view_keyboard(news_id: int, pending: bool) -> types.InlineKeyboardMarkup:
+        """
+        Клавиатура превью публикации (кэшируется: зависит только от ID и статуса)
 
-            # Создаем inline клавиатуру
-            keyboard = types.InlineKeyboardMarkup(row_width=1)
+        Args:
+            news_id: ID новости
+            pending: Новость еще не опубликована (добавляются кнопки действий)
+        """
+        keyboard = types.InlineKeyboardMarkup(row_width=2)
+
+        if pending:
             keyboard.add(
                 types.InlineKeyboardButton(
-                    "📝 Изменить стиль написания",
-                    callback_data="settings_style"
-                ),
-                types.InlineKeyboardButton(
-                    "📏 Изменить длину текста",
-                    callback_data="settings_length"
+                    "🚀 Опубликовать",
+                    callback_data=f"publish_confirm_{news_id}"
                 ),
                 types.InlineKeyboardButton(
-                    "🔄 Перезагрузить настройки",
-                    callback_data="cmd_reload_config"
+                    "✏️ Переписать",
+                    callback_data=f"rewrite_{news_id}_select_both"
                 )
             )
             keyboard.add(
                 types.InlineKeyboardButton(
-                    "⚙️ Интерактивные настройки",
-                    callback_data="cmd_settings"
+                    "🗑️ Удалить",
+                    callback_data=f"delete_confirm_{news_id}"
                 )
             )
 
-            self.bot.reply_to(message, config_text, parse_mode='HTML', reply_markup=keyboard)
+        keyboard.add(*_VIEW_NAV_BUTTONS)
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /config: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
+        return keyboard
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _publish_confirm_keyboard(news_id: int) -> types.InlineKeyboardMarkup:
+        """Клавиатура подтверждения публикации (кэшируется по ID новости)"""
+        keyboard = types.InlineKeyboardMarkup(row_width=2)
+        keyboard.add(
+            types.InlineKeyboardButton(
+                "✅ Да, опубликовать",
+                callback_data=f"publish_execute_{news_id}"
+            ),
+            types.InlineKeyboardButton(
+                "❌ Отмена",
+                callback_data="publish_cancel"
+            )
+        )
+        return keyboard
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _delete_confirm_keyboard(news_id: int) -> types.InlineKeyboardMarkup:
+        """Клавиатура подтверждения удаления (кэшируется по ID новости)"""
+        keyboard = types.InlineKeyboardMarkup(row_width=2)
+        keyboard.add(
+            types.InlineKeyboardButton(
+                "✅ Да, удалить",
+                callback_data=f"delete_execute_{news_id}"
+            ),
+            types.InlineKeyboardButton(
+                "❌ Отмена",
+                callback_data="delete_cancel"
+            )
+        )
+        return keyboard
+
+    @command_errors("/config")
+    @require_admin("/config")
+    def _cmd_config(self, message: types.Message):
+        """Команда /config - показать все настройки бота"""
+        # Получаем все настройки из БД
+        all_configs = self.db.get_all_config()
+
+        if not all_configs:
+            self.bot.reply_to(message, "⚠️ Нет настроек в базе данных", parse_mode=None)
+            return
+
+        # Форматируем список настроек (используем HTML для более надежного парсинга)
+        config_lines = ''.join(
+            f"<b>{key}:</b> <code>{html.escape(value)}</code>\n"
+            for key, value in all_configs.items()
+        )
+        config_text = (
+            "⚙️ <b>Настройки бота из базы данных:</b>\n\n"
+            f"{config_lines}"
+            "\nИспользуйте /set_config для изменения или выберите настройку из меню:"
+        )
+
+        # Список настроек не привязан к сообщению с командой - отправляем без reply
+        self.bot.send_message(message.chat.id, config_text, parse_mode='HTML', reply_markup=self._config_keyboard)
 
+    @require_admin("/webhook_info")
     def _cmd_webhook_info(self, message: types.Message):
         """Команда /webhook_info - показать информацию о webhook"""
         try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /webhook_info от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
-
             # Получаем информацию о webhook
             webhook_info = self.bot.get_webhook_info()
 
@@ -1039,14 +1435,12 @@ class TelegramHandler:
 
             # Информация об ошибках
             if webhook_info.last_error_date:
-                from datetime import datetime
                 error_date = datetime.fromtimestamp(webhook_info.last_error_date)
                 info_text += f"\n⚠️ <b>Последняя ошибка:</b>\n"
                 info_text += f"Дата: {error_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
                 info_text += f"Сообщение: {webhook_info.last_error_message}\n"
 
             if webhook_info.last_synchronization_error_date:
-                from datetime import datetime
                 sync_error_date = datetime.fromtimestamp(webhook_info.last_synchronization_error_date)
                 info_text += f"\n⚠️ <b>Ошибка синхронизации:</b>\n"
                 info_text += f"Дата: {sync_error_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
@@ -1064,225 +1458,123 @@ class TelegramHandler:
             logger.info("Информация о webhook отправлена")
 
         except Exception as e:
-            logger.error(f"Ошибка в команде /webhook_info: {e}", exc_info=True)
+            logger.error("Ошибка в команде /webhook_info: %s", e, exc_info=True)
             self.bot.reply_to(
                 message,
                 "❌ Ошибка при получении информации о webhook\n"
-                f"Подробности: {str(e)}"
+                f"Подробности: {html.escape(str(e))}"
             )
 
+    @command_errors("/set_config")
+    @require_admin("/set_config")
     def _cmd_set_config(self, message: types.Message):
         """Команда /set_config <key> <value> - установить настройку"""
-        try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /set_config от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
-
-            # Извлекаем параметры из команды
-            parts = message.text.split(maxsplit=2)
-            if len(parts) < 3:
-                self.bot.reply_to(
-                    message,
-                    "Использование: /set_config [key] [value]\n\n"
-                    "Доступные настройки:\n"
-                    "- PUBLISH_SCHEDULE (например: 8,12,16,20)\n"
-                    "- URGENT_KEYWORDS (например: молния,breaking)\n"
-                    "- MAX_ARTICLES_PER_RUN (например: 5)\n"
-                    "- ARTICLE_STYLE (например: informative)\n"
-                    "- TEXT_LENGTH (например: short, medium, long)\n"
-                    "- CHECK_INTERVAL (например: 60)\n"
-                    "- MONITOR_FROM_DATE (например: 2025-01-01 00:00:00)\n\n"
-                    "Используйте /config для просмотра текущих настроек",
-                    parse_mode=None
-                )
-                return
-
-            # Нормализуем ключ: убираем лидирующие дефисы и приводим к верхнему регистру
-            key = parts[1].lstrip('-').upper()
-            value = parts[2]
-
-            # Список допустимых ключей конфигурации
-            valid_keys = [
-                'PUBLISH_SCHEDULE', 'URGENT_KEYWORDS', 'MAX_ARTICLES_PER_RUN',
-                'ARTICLE_STYLE', 'TEXT_LENGTH', 'CHECK_INTERVAL', 'MONITOR_FROM_DATE'
-            ]
-
-            # Проверяем, что ключ допустим
-            if key not in valid_keys:
-                self.bot.reply_to(
-                    message,
-                    f"❌ Недопустимый ключ: {key}\n\n"
-                    f"Допустимые ключи:\n" + "\n".join([f"- {k}" for k in valid_keys]),
-                    parse_mode=None
-                )
-                return
-
-            # Обновляем настройку
-            if Config.update_config(key, value):
-                logger.info(f"Настройка {key} обновлена на: {value}")
-
-                # Если это стиль - обновляем DeepSeek
-                if key == 'ARTICLE_STYLE':
-                    self.deepseek.set_style(value)
-
-                # Если это ключевые слова - обновляем локальный кэш
-                if key == 'URGENT_KEYWORDS':
-                    self.urgent_keywords = Config.get_urgent_keywords()
-
-                self.bot.reply_to(
-                    message,
-                    f"✅ Настройка обновлена:\n<b>{key}</b> = <code>{value}</code>\n\n"
-                    f"⚠️ Некоторые изменения (например, PUBLISH_SCHEDULE) "
-                    f"потребуют перезапуска бота для полного применения.",
-                    parse_mode='HTML'
-                )
-            else:
-                self.bot.reply_to(message, f"❌ Ошибка при обновлении настройки {key}")
-
-        except Exception as e:
-            logger.error(f"Ошибка в команде /set_config: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
-
-    def _cmd_reload_config(self, message: types.Message):
-        """Команда /reload_config - перезагрузить настройки из БД"""
-        try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /reload_config от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
-
-            # Перезагружаем настройки из БД
-            Config.reload_from_database()
-
-            # Обновляем стиль в DeepSeek
-            self.deepseek.set_style(Config.get_article_style())
-
-            # Обновляем ключевые слова
-            self.urgent_keywords = Config.get_urgent_keywords()
-
-            logger.info("Настройки перезагружены из БД")
-
+        # Извлекаем параметры из команды
+        parts = message.text.split(maxsplit=2)
+        if len(parts) < 3:
             self.bot.reply_to(
                 message,
-                f"✅ Настройки перезагружены из базы данных\n\n"
-                f"Текущие настройки:\n"
-                f"- PUBLISH_SCHEDULE: `{Config.PUBLISH_SCHEDULE}`\n"
-                f"- ARTICLE_STYLE: `{Config.ARTICLE_STYLE}`\n"
-                f"- URGENT_KEYWORDS: `{Config.URGENT_KEYWORDS}`\n"
-                f"- MAX_ARTICLES_PER_RUN: `{Config.MAX_ARTICLES_PER_RUN}`\n\n"
-                f"⚠️ Изменения в PUBLISH_SCHEDULE потребуют перезапуска бота",
-                parse_mode='Markdown'
+                "Использование: /set_config [key] [value]\n\n"
+                "Доступные настройки:\n"
+                "- PUBLISH_SCHEDULE (например: 8,12,16,20)\n"
+                "- URGENT_KEYWORDS (например: молния,breaking)\n"
+                "- MAX_ARTICLES_PER_RUN (например: 5)\n"
+                "- ARTICLE_STYLE (например: informative)\n"
+                "- TEXT_LENGTH (например: short, medium, long)\n"
+                "- CHECK_INTERVAL (например: 60)\n"
+                "- MONITOR_FROM_DATE (например: 2025-01-01 00:00:00)\n\n"
+                "Используйте /config для просмотра текущих настроек",
+                parse_mode=None
             )
+            return
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /reload_config: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
+        # Нормализуем ключ: убираем лидирующие дефисы и приводим к верхнему регистру
+        key = parts[1].lstrip('-').upper()
+        value = parts[2]
 
-    def _cmd_settings(self, message: types.Message):
-        """Команда /settings - главное меню настроек с кнопками"""
-        try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /settings от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
+        # Список допустимых ключей конфигурации
+        valid_keys = [
+            'PUBLISH_SCHEDULE', 'URGENT_KEYWORDS', 'MAX_ARTICLES_PER_RUN',
+            'ARTICLE_STYLE', 'TEXT_LENGTH', 'CHECK_INTERVAL', 'MONITOR_FROM_DATE'
+        ]
 
-            # Создаем inline клавиатуру с кнопками настроек
-            keyboard = types.InlineKeyboardMarkup(row_width=1)
-
-            current_style = self.deepseek.get_style()
-            current_length = Config.get_text_length()
-            monitor_date = Config.get_monitor_from_date() or "С момента запуска"
-
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    f"📝 Стиль: {current_style}",
-                    callback_data="settings_style"
-                ),
-                types.InlineKeyboardButton(
-                    f"📏 Длина текста: {current_length}",
-                    callback_data="settings_length"
-                ),
-                types.InlineKeyboardButton(
-                    f"📅 Мониторить с: {monitor_date[:19]}",
-                    callback_data="settings_date"
-                )
+        # Проверяем, что ключ допустим
+        if key not in valid_keys:
+            self.bot.reply_to(
+                message,
+                f"❌ Недопустимый ключ: {key}\n\n"
+                f"Допустимые ключи:\n" + "\n".join([f"- {k}" for k in valid_keys]),
+                parse_mode=None
             )
+            return
 
-            settings_text = f"""
-⚙️ **Настройки бота**
+        # Обновляем настройку
+        if Config.update_config(key, value):
+            logger.info("Настройка %s обновлена на: %s", key, value)
 
-Текущие параметры:
-• Стиль написания: `{current_style}`
-• Длина текста: `{current_length}` ({Config.get_text_length_chars()} символов)
-• Мониторинг с: `{monitor_date}`
+            # Если это стиль - обновляем DeepSeek
+            if key == 'ARTICLE_STYLE':
+                self.deepseek.set_style(value)
 
-Нажмите на кнопку для изменения настройки.
-"""
+            # Если это ключевые слова - обновляем локальный кэш
+            if key == 'URGENT_KEYWORDS':
+                self._refresh_urgent_keywords()
 
             self.bot.reply_to(
                 message,
-                settings_text,
-                parse_mode='Markdown',
-                reply_markup=keyboard
+                f"✅ Настройка обновлена:\n<b>{key}</b> = <code>{value}</code>\n\n"
+                f"⚠️ Некоторые изменения (например, PUBLISH_SCHEDULE) "
+                f"потребуют перезапуска бота для полного применения.",
+                parse_mode='HTML'
             )
+        else:
+            self.bot.reply_to(message, f"❌ Ошибка при обновлении настройки {key}")
 
-        except Exception as e:
-            logger.error(f"Ошибка в команде /settings: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
+    @command_errors("/reload_config")
+    @require_admin("/reload_config")
+    def _cmd_reload_config(self, message: types.Message):
+        """Команда /reload_config - перезагрузить настройки из БД"""
+        # Перезагружаем настройки из БД
+        Config.reload_from_database()
+
+        # Обновляем стиль в DeepSeek
+        self.deepseek.set_style(Config.get_article_style())
+
+        # Обновляем ключевые слова
+        self._refresh_urgent_keywords()
+
+        logger.info("Настройки перезагружены из БД")
+
+        self.bot.send_message(
+            message.chat.id,
+            f"✅ Настройки перезагружены из базы данных\n\n"
+            f"Текущие настройки:\n"
+            f"- PUBLISH_SCHEDULE: <code>{html.escape(str(Config.PUBLISH_SCHEDULE))}</code>\n"
+            f"- ARTICLE_STYLE: <code>{html.escape(str(Config.ARTICLE_STYLE))}</code>\n"
+            f"- URGENT_KEYWORDS: <code>{html.escape(str(Config.URGENT_KEYWORDS))}</code>\n"
+            f"- MAX_ARTICLES_PER_RUN: <code>{html.escape(str(Config.MAX_ARTICLES_PER_RUN))}</code>\n\n"
+            f"⚠️ Изменения в PUBLISH_SCHEDULE потребуют перезапуска бота",
+            parse_mode='HTML'
+        )
+
+    @command_errors("/settings")
+    @require_admin("/settings")
+    def _cmd_settings(self, message: types.Message):
+        """Команда /settings - главное меню настроек с кнопками"""
+        settings_text, keyboard = self._build_settings_menu()
+
+        self.bot.send_message(
+            message.chat.id,
+            settings_text,
+            parse_mode='HTML',
+            reply_markup=keyboard
+        )
 
+    @command_errors("/rewrite")
+    @require_admin("/rewrite")
     def _cmd_rewrite(self, message: types.Message):
         """Команда /rewrite <id> - переписать статью с новым стилем/длиной"""
         try:
-            user_id = str(message.from_user.id)
-            logger.info(f"Команда /rewrite от пользователя ID: {user_id}")
-
-            # Проверка прав администратора
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    logger.warning(f"Отказано в доступе для пользователя {user_id}")
-                    self.bot.reply_to(
-                        message,
-                        f"❌ У вас нет прав для выполнения этой команды\n"
-                        f"Ваш ID: {user_id}"
-                    )
-                    return
-            else:
-                logger.warning("ADMIN_USER_ID не установлен в конфиге - команда доступна всем!")
-
             # Извлекаем ID из команды
             parts = message.text.split()
             if len(parts) < 2:
@@ -1296,10 +1588,10 @@ class TelegramHandler:
                 return
 
             news_id = int(parts[1])
-            logger.info(f"Запрос на переписывание статьи ID: {news_id}")
+            logger.info("Запрос на переписывание статьи ID: %s", news_id)
 
             # Получаем новость из БД
-            news = self.db.get_news_by_id(news_id)
+            news = self._get_news_cached(news_id)
             if not news:
                 self.bot.reply_to(message, f"❌ Статья с ID {news_id} не найдена")
                 return
@@ -1309,9 +1601,6 @@ class TelegramHandler:
 
         except ValueError:
             self.bot.reply_to(message, "Неверный формат ID. Используйте: /rewrite [id]", parse_mode=None)
-        except Exception as e:
-            logger.error(f"Ошибка в команде /rewrite: {e}")
-            self.bot.reply_to(message, "Ошибка при выполнении команды")
 
     def _show_rewrite_menu(self, message: types.Message, news_id: int):
         """Показать меню выбора параметров для переписывания"""
@@ -1320,31 +1609,17 @@ class TelegramHandler:
         current_style = self.deepseek.get_style()
         current_length = Config.get_text_length()
 
-        keyboard.add(
-            types.InlineKeyboardButton(
-                "📝 Изменить только стиль",
-                callback_data=f"rewrite_{news_id}_select_style_only"
-            ),
-            types.InlineKeyboardButton(
-                "📏 Изменить только длину",
-                callback_data=f"rewrite_{news_id}_select_length_only"
-            ),
-            types.InlineKeyboardButton(
-                "🔄 Изменить стиль И длину",
-                callback_data=f"rewrite_{news_id}_select_both"
-            ),
-            types.InlineKeyboardButton(
-                "✅ Переписать с текущими настройками",
-                callback_data=f"rewrite_{news_id}_confirm_current"
-            )
-        )
+        keyboard.add(*[
+            types.InlineKeyboardButton(label, callback_data=f"rewrite_{news_id}_{action}")
+            for label, action in self.REWRITE_MENU_ACTIONS
+        ])
 
         menu_text = f"""
-✏️ **Переписывание статьи ID {news_id}**
+✏️ <b>Переписывание статьи ID {news_id}</b>
 
 Текущие параметры:
-• **Стиль**: {current_style}
-• **Длина**: {current_length} ({Config.get_text_length_chars()} символов)
+• <b>Стиль</b>: {current_style}
+• <b>Длина</b>: {current_length} ({Config.AVAILABLE_TEXT_LENGTHS[current_length]} символов)
 
 Выберите, что хотите изменить:
 """
@@ -1352,207 +1627,266 @@ class TelegramHandler:
         self.bot.reply_to(
             message,
             menu_text,
-            parse_mode='Markdown',
+            parse_mode='HTML',
             reply_markup=keyboard
         )
 
     def _handle_callback_query(self, call):
         """Обработчик callback запросов от inline кнопок"""
         try:
-            user_id = str(call.from_user.id)
+            data = call.data
 
             # Обработка команд навигации (доступны всем)
-            if call.data == "cmd_status":
-                self._handle_cmd_callback(call, self._cmd_status)
-                return
-            elif call.data == "cmd_queue":
-                self._handle_cmd_callback(call, self._cmd_queue)
-                return
-            elif call.data == "cmd_help":
-                self._handle_cmd_callback(call, self._cmd_help)
+            cmd_func = self._cb_commands.get(data)
+            if cmd_func:
+                self._handle_cmd_callback(call, cmd_func)
                 return
-            elif call.data == "cmd_settings":
-                self._handle_cmd_callback(call, self._cmd_settings)
-                return
-            elif call.data == "cmd_get_style":
-                self._handle_cmd_callback(call, self._cmd_get_style)
+
+            # Проверка прав администратора для остальных действий
+            if not self._is_admin(call.from_user.id):
+                self.bot.answer_callback_query(
+                    call.id,
+                    "❌ У вас нет прав для изменения настроек"
+                )
                 return
-            elif call.data == "cmd_reload_config":
-                self._handle_cmd_callback(call, self._cmd_reload_config)
+
+            handler = self._cb_exact.get(data)
+            if handler:
+                handler(call)
                 return
 
-            # Проверка прав администратора для остальных действий
-            if Config.ADMIN_USER_ID:
-                if user_id != Config.ADMIN_USER_ID:
-                    self.bot.answer_callback_query(
-                        call.id,
-                        "❌ У вас нет прав для изменения настроек"
-                    )
+            for prefix, handler in self._cb_id_prefixes:
+                if data.startswith(prefix):
+                    handler(call, int(data[len(prefix):]))
                     return
 
-            # Обработка пагинации очереди
-            if call.data.startswith("queue_page:"):
-                page = int(call.data.replace("queue_page:", ""))
-                self._handle_queue_page_callback(call, page)
-            # Обработка просмотра новостей
-            elif call.data.startswith("view_"):
-                news_id = int(call.data.replace("view_", ""))
-                self._handle_view_callback(call, news_id)
-            # Обработка публикации
-            elif call.data.startswith("publish_confirm_"):
-                news_id = int(call.data.replace("publish_confirm_", ""))
-                self._show_publish_confirmation(call, news_id)
-            elif call.data.startswith("publish_execute_"):
-                news_id = int(call.data.replace("publish_execute_", ""))
-                self._execute_publish(call, news_id)
-            elif call.data == "publish_cancel":
-                self._handle_cancel_callback(call, "Публикация отменена")
-            # Обработка удаления
-            elif call.data.startswith("delete_confirm_"):
-                news_id = int(call.data.replace("delete_confirm_", ""))
-                self._show_delete_confirmation(call, news_id)
-            elif call.data.startswith("delete_execute_"):
-                news_id = int(call.data.replace("delete_execute_", ""))
-                self._execute_delete(call, news_id)
-            elif call.data == "delete_cancel":
-                self._handle_cancel_callback(call, "Удаление отменено")
-            # Обработка очистки очереди
-            elif call.data == "clear_queue_execute":
-                self._execute_clear_queue(call)
-            elif call.data == "clear_queue_cancel":
-                self._handle_cancel_callback(call, "Очистка очереди отменена")
-            # Обработка настроек
-            elif call.data == "settings_style":
-                self._show_style_keyboard(call)
-            elif call.data == "settings_length":
-                self._show_length_keyboard(call)
-            elif call.data == "settings_date":
-                self._show_date_settings(call)
-            elif call.data.startswith("style_"):
-                self._set_style_from_callback(call)
-            elif call.data.startswith("length_"):
-                self._set_length_from_callback(call)
-            elif call.data == "back_to_settings":
-                self._show_settings_menu(call)
-            # Обработка переписывания
-            elif call.data.startswith("rewrite_"):
-                self._handle_rewrite_callback(call)
+            for prefix, handler in self._cb_prefixes:
+                if data.startswith(prefix):
+                    handler(call)
+                    return
 
         except Exception as e:
-            logger.error(f"Ошибка в обработчике callback: {e}")
+            logger.error("Ошибка в обработчике callback: %s", e)
             self.bot.answer_callback_query(call.id, "Ошибка при обработке запроса")
 
-    def _show_style_keyboard(self, call):
-        """Показать клавиатуру выбора стиля"""
-        keyboard = types.InlineKeyboardMarkup(row_width=1)
+    def _answer_callback_async(self, call_id: str, text: Optional[str] = None):
+        """Ответить на callback запрос в фоне (ошибки только логируются)"""
+        def answer():
+            try:
+                self.bot.answer_callback_query(call_id, text)
+            except Exception as e:
+                logger.warning("Не удалось ответить на callback запрос: %s", e)
 
-        style_names = {
-            'informative': '📰 Информативный',
-            'ironic': '😏 Ироничный',
-            'cynical': '😒 Циничный',
-            'playful': '😄 Шутливый',
-            'mocking': '🤣 Стебной'
-        }
+        self._callback_answer_executor.submit(answer)
 
-        current_style = self.deepseek.get_style()
+    def _claim_inflight(self, call, key: tuple) -> bool:
+        """
+        Отметить действие как выполняющееся
 
-        for style_key, style_name in style_names.items():
-            checkmark = " ✓" if style_key == current_style else ""
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    f"{style_name}{checkmark}",
-                    callback_data=f"style_{style_key}"
-                )
-            )
+        Если то же действие пользователя еще выполняется (повторное нажатие кнопки),
+        отвечает на callback и возвращает False.
 
-        keyboard.add(
-            types.InlineKeyboardButton("← Назад", callback_data="back_to_settings")
-        )
+        Args:
+            call: Callback запрос
+            key: (user_id, действие, news_id)
 
-        self.bot.edit_message_text(
-            "📝 **Выберите стиль написания:**\n\nСтиль применяется ко всем новым статьям.",
-            chat_id=call.message.chat.id,
-            message_id=call.message.message_id,
-            parse_mode='Markdown',
-            reply_markup=keyboard
-        )
+        Returns:
+            True, если действие можно выполнять
+        """
+        with self._inflight_lock:
+            if key in self._inflight:
+                claimed = False
+            else:
+                self._inflight.add(key)
+                claimed = True
+
+        if not claimed:
+            self._answer_callback_async(call.id, "⏳ Уже выполняется...")
+        return claimed
+
+    def _release_inflight(self, key: tuple):
+        """Снять отметку выполняющегося действия"""
+        with self._inflight_lock:
+            self._inflight.discard(key)
+
+    def _report_error_async(self, call, text: str):
+        """
+        Сообщить об ошибке операции правкой сообщения в фоне
+
+        Правка необязательная: обработчик не ждет ее завершения, при ответе 429
+        повторяется после retry_after, остальные ошибки только логируются.
+
+        Args:
+            call: Callback запрос
+            text: Текст сообщения об ошибке (HTML)
+        """
+        def report():
+            for attempt in range(FLOOD_RETRY_ATTEMPTS + 1):
+                try:
+                    self._edit_paced(call, text, parse_mode='HTML')
+                    return
+                except apihelper.ApiTelegramException as e:
+                    if e.error_code != 429 or attempt == FLOOD_RETRY_ATTEMPTS:
+                        logger.warning("Не удалось сообщить об ошибке: %s", e)
+                        return
+                    retry_after = (e.result_json.get('parameters') or {}).get('retry_after', 1)
+                    time.sleep(retry_after)
+                except Exception as e:
+                    logger.warning("Не удалось сообщить об ошибке: %s", e)
+                    return
+
+        self._error_report_executor.submit(report)
+
+    def _edit_paced(self, call, text: str, **kwargs):
+        """
+        Отредактировать сообщение callback запроса не чаще MIN_EDIT_INTERVAL
+
+        Если предыдущая правка этого же сообщения была только что,
+        дожидается конца интервала (используется для сообщений о ходе
+        публикации, удаления и переписывания).
+
+        Args:
+            call: Callback запрос
+            text: Новый текст сообщения
+            **kwargs: Дополнительные параметры edit_message_text
+        """
+        key = (call.message.chat.id, call.message.message_id)
+
+        with self._last_edit_lock:
+            last = self._last_edit_ts.get(key)
+        if last is not None:
+            delay = last + MIN_EDIT_INTERVAL - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        try:
+            return self.bot.edit_message_text(text, chat_id=key[0], message_id=key[1], **kwargs)
+        finally:
+            with self._last_edit_lock:
+                self._last_edit_ts[key] = time.monotonic()
+                self._last_edit_ts.move_to_end(key)
+                if len(self._last_edit_ts) > MENU_EDIT_CACHE_SIZE:
+                    self._last_edit_ts.popitem(last=False)
+
+    def _edit_menu(self, call, text: str, keyboard: types.InlineKeyboardMarkup):
+        """
+        Отредактировать сообщение с меню настроек, пропуская правку без изменений
+
+        Telegram отвечает ошибкой "message is not modified" на правку с тем же
+        текстом и клавиатурой, поэтому такие правки не отправляются.
+
+        Args:
+            call: Callback запрос
+            text: Новый текст сообщения (HTML)
+            keyboard: Новая клавиатура
+        """
+        key = (call.message.chat.id, call.message.message_id)
+        content_hash = hash((text, keyboard.to_json()))
+
+        with self._menu_edit_lock:
+            if self._menu_edit_cache.get(key) == content_hash:
+                return
+
+        try:
+            self.bot.edit_message_text(
+                text,
+                chat_id=key[0],
+                message_id=key[1],
+                parse_mode='HTML',
+                reply_markup=keyboard
+            )
+        except apihelper.ApiTelegramException as e:
+            if 'message is not modified' not in str(e):
+                raise
+
+        with self._menu_edit_lock:
+            self._menu_edit_cache[key] = content_hash
+            self._menu_edit_cache.move_to_end(key)
+            if len(self._menu_edit_cache) > MENU_EDIT_CACHE_SIZE:
+                self._menu_edit_cache.popitem(last=False)
 
-        self.bot.answer_callback_query(call.id)
+    @staticmethod
+    def _build_choice_keyboard(names: dict, prefix: str, selected: str,
+                               with_back: bool = True, suffix: str = "") -> types.InlineKeyboardMarkup:
+        """
+        Собрать клавиатуру выбора значения с отметкой текущего
 
-    def _show_length_keyboard(self, call):
-        """Показать клавиатуру выбора длины текста"""
+        Используется и в меню настроек, и в меню переписывания статьи.
+
+        Args:
+            names: Словарь {ключ: название кнопки}
+            prefix: Префикс callback_data
+            selected: Текущее значение (отмечается ✓)
+            with_back: Добавить кнопку возврата в меню настроек
+            suffix: Суффикс callback_data после ключа
+        """
         keyboard = types.InlineKeyboardMarkup(row_width=1)
 
-        length_names = {
-            'short': '📄 Короткий (1000 символов)',
-            'medium': '📃 Средний (2000 символов)',
-            'long': '📰 Длинный (3000 символов)'
-        }
+        keyboard.add(*[
+            types.InlineKeyboardButton(
+                f"{name} ✓" if key == selected else name,
+                callback_data=f"{prefix}{key}{suffix}"
+            )
+            for key, name in names.items()
+        ])
 
-        current_length = Config.get_text_length()
+        if with_back:
+            keyboard.add(_BACK_TO_SETTINGS_BUTTON)
 
-        for length_key, length_name in length_names.items():
-            checkmark = " ✓" if length_key == current_length else ""
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    f"{length_name}{checkmark}",
-                    callback_data=f"length_{length_key}"
-                )
-            )
+        return keyboard
 
-        keyboard.add(
-            types.InlineKeyboardButton("← Назад", callback_data="back_to_settings")
-        )
+    def _show_style_keyboard(self, call):
+        """Показать клавиатуру выбора стиля"""
+        keyboard = self._style_keyboards[self.deepseek.get_style()]
 
-        self.bot.edit_message_text(
-            "📏 **Выберите длину текста:**\n\nДлина применяется ко всем новым статьям.",
-            chat_id=call.message.chat.id,
-            message_id=call.message.message_id,
-            parse_mode='Markdown',
-            reply_markup=keyboard
-        )
+        self._answer_callback_async(call.id)
 
-        self.bot.answer_callback_query(call.id)
+        self._edit_menu(call, "📝 <b>Выберите стиль написания:</b>\n\nСтиль применяется ко всем новым статьям.", keyboard)
+
+    def _show_length_keyboard(self, call):
+        """Показать клавиатуру выбора длины текста"""
+        keyboard = self._length_keyboards[Config.get_text_length()]
+
+        self._answer_callback_async(call.id)
+
+        self._edit_menu(call, "📏 <b>Выберите длину текста:</b>\n\nДлина применяется ко всем новым статьям.", keyboard)
 
     def _show_date_settings(self, call):
         """Показать настройки даты мониторинга"""
-        keyboard = types.InlineKeyboardMarkup(row_width=1)
-        keyboard.add(
-            types.InlineKeyboardButton("← Назад", callback_data="back_to_settings")
-        )
+        keyboard = self._back_to_settings_keyboard
 
         current_date = Config.get_monitor_from_date() or "Не установлена (с момента запуска)"
 
         instructions = f"""
-📅 **Настройка даты мониторинга**
+📅 <b>Настройка даты мониторинга</b>
 
-Текущая дата: `{current_date}`
+Текущая дата: <code>{html.escape(current_date)}</code>
 
 Чтобы изменить дату мониторинга, используйте команду:
-`/set_config MONITOR_FROM_DATE "YYYY-MM-DD HH:MM:SS"`
+<code>/set_config MONITOR_FROM_DATE "YYYY-MM-DD HH:MM:SS"</code>
 
 Примеры:
-• `/set_config MONITOR_FROM_DATE "2025-01-01 00:00:00"`
-• `/set_config MONITOR_FROM_DATE ""` (сбросить)
+• <code>/set_config MONITOR_FROM_DATE "2025-01-01 00:00:00"</code>
+• <code>/set_config MONITOR_FROM_DATE ""</code> (сбросить)
 
 После изменения требуется перезапуск бота.
 """
 
-        self.bot.edit_message_text(
-            instructions,
-            chat_id=call.message.chat.id,
-            message_id=call.message.message_id,
-            parse_mode='Markdown',
-            reply_markup=keyboard
-        )
+        self._answer_callback_async(call.id)
 
-        self.bot.answer_callback_query(call.id)
+        self._edit_menu(call, instructions, keyboard)
 
     def _set_style_from_callback(self, call):
         """Установить стиль из callback"""
-        style = call.data.replace("style_", "")
+        style = call.data[len("style_"):]
 
         if style in Config.AVAILABLE_STYLES:
+            if style == self.deepseek.get_style():
+                # Стиль уже выбран - не пишем в БД, только возвращаемся в меню
+                self.bot.answer_callback_query(call.id, "Уже выбрано")
+                self._show_settings_menu(call, answer=False)
+                return
+
             # Обновляем стиль в DeepSeek
             self.deepseek.set_style(style)
 
@@ -1565,7 +1899,7 @@ class TelegramHandler:
             )
 
             # Обновляем меню
-            self._show_settings_menu(call)
+            self._show_settings_menu(call, answer=False)
         else:
             self.bot.answer_callback_query(
                 call.id,
@@ -1574,9 +1908,15 @@ class TelegramHandler:
 
     def _set_length_from_callback(self, call):
         """Установить длину текста из callback"""
-        length = call.data.replace("length_", "")
+        length = call.data[len("length_"):]
 
         if length in Config.AVAILABLE_TEXT_LENGTHS:
+            if length == Config.get_text_length():
+                # Длина уже выбрана - не пишем в БД, только возвращаемся в меню
+                self.bot.answer_callback_query(call.id, "Уже выбрано")
+                self._show_settings_menu(call, answer=False)
+                return
+
             # Сохраняем в БД
             Config.update_config('TEXT_LENGTH', length)
 
@@ -1587,21 +1927,32 @@ class TelegramHandler:
             )
 
             # Обновляем меню
-            self._show_settings_menu(call)
+            self._show_settings_menu(call, answer=False)
         else:
             self.bot.answer_callback_query(
                 call.id,
                 "❌ Неизвестная длина"
             )
 
-    def _show_settings_menu(self, call):
-        """Показать главное меню настроек"""
-        keyboard = types.InlineKeyboardMarkup(row_width=1)
+    def _build_settings_menu(self):
+        """
+        Собрать текст и клавиатуру главного меню настроек
 
+        Результат кэшируется по текущим значениям настроек и пересобирается
+        только после их изменения.
+
+        Returns:
+            tuple: (settings_text, keyboard)
+        """
         current_style = self.deepseek.get_style()
         current_length = Config.get_text_length()
         monitor_date = Config.get_monitor_from_date() or "С момента запуска"
 
+        cache_key = (current_style, current_length, monitor_date)
+        if self._settings_menu_cache and self._settings_menu_cache[0] == cache_key:
+            return self._settings_menu_cache[1]
+
+        keyboard = types.InlineKeyboardMarkup(row_width=1)
         keyboard.add(
             types.InlineKeyboardButton(
                 f"📝 Стиль: {current_style}",
@@ -1617,26 +1968,30 @@ class TelegramHandler:
             )
         )
 
-        settings_text = f"""
-⚙️ **Настройки бота**
+        settings_text = self.SETTINGS_MENU_TEMPLATE.format(
+            style=current_style,
+            length=current_length,
+            chars=Config.AVAILABLE_TEXT_LENGTHS[current_length],
+            monitor_date=html.escape(monitor_date)
+        )
 
-Текущие параметры:
-• Стиль написания: `{current_style}`
-• Длина текста: `{current_length}` ({Config.get_text_length_chars()} символов)
-• Мониторинг с: `{monitor_date}`
+        self._settings_menu_cache = (cache_key, (settings_text, keyboard))
+        return settings_text, keyboard
 
-Нажмите на кнопку для изменения настройки.
-"""
+    def _show_settings_menu(self, call, answer: bool = True):
+        """
+        Показать главное меню настроек
 
-        self.bot.edit_message_text(
-            settings_text,
-            chat_id=call.message.chat.id,
-            message_id=call.message.message_id,
-            parse_mode='Markdown',
-            reply_markup=keyboard
-        )
+        Args:
+            call: Callback запрос
+            answer: Ответить на callback (False, если ответ уже отправлен вызывающим)
+        """
+        settings_text, keyboard = self._build_settings_menu()
 
-        self.bot.answer_callback_query(call.id)
+        if answer:
+            self._answer_callback_async(call.id)
+
+        self._edit_menu(call, settings_text, keyboard)
 
     def _handle_rewrite_callback(self, call):
         """Обработчик callback для переписывания статьи"""
@@ -1644,18 +1999,16 @@ class TelegramHandler:
             user_id = call.from_user.id
             username = call.from_user.username or "без username"
 
-            data_parts = call.data.split("_")
-
             # Формат: rewrite_{news_id}_{action}[_{params}...]
-            if len(data_parts) < 3:
-                logger.warning(f"Неверный формат callback данных от пользователя {user_id} (@{username}): {call.data}")
+            news_id_str, _, action = call.data[len("rewrite_"):].partition("_")  # Все остальное - action
+            if not action:
+                logger.warning("Неверный формат callback данных от пользователя %s (@%s): %s", user_id, username, call.data)
                 self.bot.answer_callback_query(call.id, "Ошибка: неверный формат данных")
                 return
 
-            news_id = int(data_parts[1])
-            action = "_".join(data_parts[2:])  # Собираем все остальное в action
+            news_id = int(news_id_str)
 
-            logger.info(f"Пользователь {user_id} (@{username}) запросил rewrite для статьи {news_id}, действие: {action}")
+            logger.info("Пользователь %s (@%s) запросил rewrite для статьи %s, действие: %s", user_id, username, news_id, action)
 
             # Обработка разных типов действий
             if action == "select_style_only":
@@ -1680,11 +2033,11 @@ class TelegramHandler:
                 # Подтверждение переписывания
                 self._handle_rewrite_confirm(call, news_id, action)
             else:
-                logger.warning(f"Неизвестное действие rewrite от пользователя {user_id} (@{username}): {action}")
+                logger.warning("Неизвестное действие rewrite от пользователя %s (@%s): %s", user_id, username, action)
                 self.bot.answer_callback_query(call.id, "Неизвестное действие")
 
         except Exception as e:
-            logger.error(f"Ошибка в обработчике callback переписывания: {e}")
+            logger.error("Ошибка в обработчике callback переписывания: %s", e)
             self.bot.answer_callback_query(call.id, "Ошибка при обработке запроса")
 
     def _show_rewrite_style_menu(self, call, news_id: int, mode: str = "style_only"):
@@ -1692,39 +2045,24 @@ class TelegramHandler:
         Показать меню выбора стиля для переписывания
         mode: "style_only" - только стиль, "both" - стиль и длина
         """
-        keyboard = types.InlineKeyboardMarkup(row_width=1)
-
-        style_names = {
-            'informative': '📰 Информативный',
-            'ironic': '😏 Ироничный',
-            'cynical': '😒 Циничный',
-            'playful': '😄 Шутливый',
-            'mocking': '🤣 Стебной'
-        }
-
         current_style = self.deepseek.get_style()
 
-        for style_key, style_name in style_names.items():
-            checkmark = " ✓" if style_key == current_style else ""
-            # Callback data зависит от режима
-            callback_data = f"rewrite_{news_id}_style_{style_key}_{mode}"
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    f"{style_name}{checkmark}",
-                    callback_data=callback_data
-                )
-            )
+        # Callback data зависит от режима
+        keyboard = self._build_choice_keyboard(
+            self.STYLE_NAMES, f"rewrite_{news_id}_style_", current_style,
+            with_back=False, suffix=f"_{mode}"
+        )
 
         if mode == "both":
-            prompt_text = f"📝 **Шаг 1/2: Выберите стиль для статьи ID {news_id}**\n\nТекущий стиль: {current_style}"
+            prompt_text = f"📝 <b>Шаг 1/2: Выберите стиль для статьи ID {news_id}</b>\n\nТекущий стиль: {current_style}"
         else:
-            prompt_text = f"📝 **Выберите новый стиль для статьи ID {news_id}:**\n\nТекущий стиль: {current_style}"
+            prompt_text = f"📝 <b>Выберите новый стиль для статьи ID {news_id}:</b>\n\nТекущий стиль: {current_style}"
 
         self.bot.edit_message_text(
             prompt_text,
             chat_id=call.message.chat.id,
             message_id=call.message.message_id,
-            parse_mode='Markdown',
+            parse_mode='HTML',
             reply_markup=keyboard
         )
 
@@ -1736,43 +2074,33 @@ class TelegramHandler:
         mode: "length_only" - только длина, "both" - и стиль, и длина
         selected_style: уже выбранный стиль (для режима "both")
         """
-        keyboard = types.InlineKeyboardMarkup(row_width=1)
-
-        length_names = {
-            'short': '📄 Короткий (1000 символов)',
-            'medium': '📃 Средний (2000 символов)',
-            'long': '📰 Длинный (3000 символов)'
-        }
-
         current_length = Config.get_text_length()
+        current_chars = Config.AVAILABLE_TEXT_LENGTHS[current_length]
 
-        for length_key, length_name in length_names.items():
-            checkmark = " ✓" if length_key == current_length else ""
-            # Callback data зависит от режима
-            if mode == "both" and selected_style:
-                callback_data = f"rewrite_{news_id}_length_{length_key}_with_style_{selected_style}"
-            else:
-                callback_data = f"rewrite_{news_id}_length_{length_key}_{mode}"
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    f"{length_name}{checkmark}",
-                    callback_data=callback_data
-                )
-            )
+        # Callback data зависит от режима
+        if mode == "both" and selected_style:
+            callback_suffix = f"_with_style_{selected_style}"
+        else:
+            callback_suffix = f"_{mode}"
+
+        keyboard = self._build_choice_keyboard(
+            self.LENGTH_NAMES, f"rewrite_{news_id}_length_", current_length,
+            with_back=False, suffix=callback_suffix
+        )
 
         if mode == "both":
-            prompt_text = f"📏 **Шаг 2/2: Выберите длину для статьи ID {news_id}**\n\n"
+            prompt_text = f"📏 <b>Шаг 2/2: Выберите длину для статьи ID {news_id}</b>\n\n"
             if selected_style:
-                prompt_text += f"Выбранный стиль: **{selected_style}**\n"
-            prompt_text += f"Текущая длина: {current_length} ({Config.get_text_length_chars()} символов)"
+                prompt_text += f"Выбранный стиль: <b>{selected_style}</b>\n"
+            prompt_text += f"Текущая длина: {current_length} ({current_chars} символов)"
         else:
-            prompt_text = f"📏 **Выберите новую длину для статьи ID {news_id}:**\n\nТекущая длина: {current_length} ({Config.get_text_length_chars()} символов)"
+            prompt_text = f"📏 <b>Выберите новую длину для статьи ID {news_id}:</b>\n\nТекущая длина: {current_length} ({current_chars} символов)"
 
         self.bot.edit_message_text(
             prompt_text,
             chat_id=call.message.chat.id,
             message_id=call.message.message_id,
-            parse_mode='Markdown',
+            parse_mode='HTML',
             reply_markup=keyboard
         )
 
@@ -1783,80 +2111,68 @@ class TelegramHandler:
         user_id = call.from_user.id
         username = call.from_user.username or "без username"
 
-        # Парсим action: style_{style_name}_{mode}
-        parts = action.split("_")
-        if len(parts) < 3:
-            logger.warning(f"Неверный формат action для выбора стиля от пользователя {user_id} (@{username}): {action}")
+        # Формат action: style_{style_name}_{mode}, mode - "style_only" или "both"
+        match = _REWRITE_STYLE_RE.match(action)
+        if not match:
+            logger.warning("Неверный формат action для выбора стиля от пользователя %s (@%s): %s", user_id, username, action)
             self.bot.answer_callback_query(call.id, "Ошибка формата")
             return
 
-        style_name = parts[1]  # Например: "ironic"
-        mode = "_".join(parts[2:])  # Например: "style_only" или "both"
+        style_name, mode = match.group('style', 'mode')
 
-        logger.info(f"Пользователь {user_id} (@{username}) выбрал стиль '{style_name}' для статьи {news_id}, режим: {mode}")
+        logger.info("Пользователь %s (@%s) выбрал стиль '%s' для статьи %s, режим: %s", user_id, username, style_name, news_id, mode)
 
         if mode == "style_only":
             # Только стиль - показываем подтверждение
             self._show_rewrite_confirmation(call, news_id, new_style=style_name, new_length=None)
-        elif mode == "both":
+        else:
             # Стиль и длина - переходим к выбору длины
             self._show_rewrite_length_menu(call, news_id, mode="both", selected_style=style_name)
-        else:
-            logger.warning(f"Неизвестный режим выбора стиля от пользователя {user_id} (@{username}): {mode}")
-            self.bot.answer_callback_query(call.id, f"Неизвестный режим: {mode}")
 
     def _handle_length_selected(self, call, news_id: int, action: str):
         """Обработка выбора длины"""
         user_id = call.from_user.id
         username = call.from_user.username or "без username"
 
-        # Парсим action: length_{length_name}_{mode} или length_{length_name}_with_style_{style_name}
-        parts = action.split("_")
-        if len(parts) < 3:
-            logger.warning(f"Неверный формат action для выбора длины от пользователя {user_id} (@{username}): {action}")
+        # Формат action: length_{length_name}_{mode} или length_{length_name}_with_style_{style_name}
+        match = _REWRITE_LENGTH_RE.match(action)
+        if not match:
+            logger.warning("Неверный формат action для выбора длины от пользователя %s (@%s): %s", user_id, username, action)
             self.bot.answer_callback_query(call.id, "Ошибка формата")
             return
 
-        length_name = parts[1]  # Например: "short"
+        length_name, style_name = match.group('length', 'style')
 
-        # Проверяем, есть ли уже выбранный стиль
-        if "with" in action and "style" in action:
-            # Формат: length_{length}_with_style_{style}
-            try:
-                style_idx = parts.index("style") + 1
-                if style_idx < len(parts):
-                    style_name = parts[style_idx]
-                    logger.info(f"Пользователь {user_id} (@{username}) выбрал длину '{length_name}' и стиль '{style_name}' для статьи {news_id}")
-                    # Оба параметра выбраны - показываем подтверждение
-                    self._show_rewrite_confirmation(call, news_id, new_style=style_name, new_length=length_name)
-                else:
-                    logger.error(f"Стиль не найден в action от пользователя {user_id} (@{username}): {action}")
-                    self.bot.answer_callback_query(call.id, "Ошибка: стиль не найден")
-            except ValueError:
-                logger.error(f"Ошибка парсинга стиля из action от пользователя {user_id} (@{username}): {action}")
-                self.bot.answer_callback_query(call.id, "Ошибка: стиль не найден")
+        if style_name:
+            # Оба параметра выбраны - показываем подтверждение
+            logger.info("Пользователь %s (@%s) выбрал длину '%s' и стиль '%s' для статьи %s", user_id, username, length_name, style_name, news_id)
+            self._show_rewrite_confirmation(call, news_id, new_style=style_name, new_length=length_name)
         else:
             # Только длина - показываем подтверждение
-            logger.info(f"Пользователь {user_id} (@{username}) выбрал длину '{length_name}' для статьи {news_id}")
+            logger.info("Пользователь %s (@%s) выбрал длину '%s' для статьи %s", user_id, username, length_name, news_id)
             self._show_rewrite_confirmation(call, news_id, new_style=None, new_length=length_name)
 
     def _show_rewrite_confirmation(self, call, news_id: int, new_style: str = None, new_length: str = None):
         """Показать подтверждение переписывания с выбранными параметрами"""
         keyboard = types.InlineKeyboardMarkup(row_width=1)
 
+        # Текущие значения читаем один раз для всех вариантов текста
+        current_style = self.deepseek.get_style()
+        current_length = Config.get_text_length()
+
         # Формируем callback_data для подтверждения
         if new_style and new_length:
             callback_data = f"rewrite_{news_id}_confirm_both_{new_style}_{new_length}"
-            params_text = f"Новый стиль: **{new_style}**\nНовая длина: **{new_length}** ({Config.AVAILABLE_TEXT_LENGTHS.get(new_length, 2000)} символов)"
+            params_text = f"Новый стиль: <b>{new_style}</b>\nНовая длина: <b>{new_length}</b> ({Config.AVAILABLE_TEXT_LENGTHS.get(new_length, 2000)} символов)"
         elif new_style:
             callback_data = f"rewrite_{news_id}_confirm_style_{new_style}"
-            params_text = f"Новый стиль: **{new_style}**\nДлина: **{Config.get_text_length()}** ({Config.get_text_length_chars()} символов)"
+            params_text = f"Новый стиль: <b>{new_style}</b>\nДлина: <b>{current_length}</b> ({Config.AVAILABLE_TEXT_LENGTHS[current_length]} символов)"
         elif new_length:
             callback_data = f"rewrite_{news_id}_confirm_length_{new_length}"
-            params_text = f"Стиль: **{self.deepseek.get_style()}**\nНовая длина: **{new_length}** ({Config.AVAILABLE_TEXT_LENGTHS.get(new_length, 2000)} символов)"
+            params_text = f"Стиль: <b>{current_style}</b>\nНовая длина: <b>{new_length}</b> ({Config.AVAILABLE_TEXT_LENGTHS.get(new_length, 2000)} символов)"
         else:
             callback_data = f"rewrite_{news_id}_confirm_current"
-            params_text = f"Стиль: **{self.deepseek.get_style()}**\nДлина: **{Config.get_text_length()}** ({Config.get_text_length_chars()} символов)"
+            params_text = f"Стиль: <b>{current_style}</b>\nДлина: <b>{current_length}</b> ({Config.AVAILABLE_TEXT_LENGTHS[current_length]} символов)"
 
         keyboard.add(
             types.InlineKeyboardButton(
@@ -1870,12 +2186,12 @@ class TelegramHandler:
         )
 
         self.bot.edit_message_text(
-            f"✏️ **Подтверждение переписывания статьи ID {news_id}**\n\n"
+            f"✏️ <b>Подтверждение переписывания статьи ID {news_id}</b>\n\n"
             f"{params_text}\n\n"
             f"Подтвердите переписывание:",
             chat_id=call.message.chat.id,
             message_id=call.message.message_id,
-            parse_mode='Markdown',
+            parse_mode='HTML',
             reply_markup=keyboard
         )
 
@@ -1883,30 +2199,16 @@ class TelegramHandler:
 
     def _handle_rewrite_confirm(self, call, news_id: int, action: str):
         """Обработка подтверждения переписывания"""
-        # Парсим action: confirm_{type}[_{params}]
-        parts = action.split("_")
-        if len(parts) < 2:
+        # Формат action: confirm_current, confirm_style_{style}, confirm_length_{length}
+        # или confirm_both_{style}_{length}
+        match = _REWRITE_CONFIRM_RE.match(action)
+        if not match:
             self.bot.answer_callback_query(call.id, "Ошибка формата")
             return
 
-        confirm_type = parts[1]  # "current", "style", "length", или "both"
-
-        new_style = None
-        new_length = None
-
-        if confirm_type == "current":
-            # Используем текущие настройки
-            pass
-        elif confirm_type == "style" and len(parts) >= 3:
-            # Только новый стиль
-            new_style = parts[2]
-        elif confirm_type == "length" and len(parts) >= 3:
-            # Только новая длина
-            new_length = parts[2]
-        elif confirm_type == "both" and len(parts) >= 4:
-            # Оба параметра
-            new_style = parts[2]
-            new_length = parts[3]
+        # Не указанные параметры (None) - используются текущие настройки
+        new_style = match.group('style') or match.group('both_style')
+        new_length = match.group('length') or match.group('both_length')
 
         # Выполняем переписывание
         self._execute_rewrite(call, news_id, new_style, new_length)
@@ -1921,39 +2223,43 @@ class TelegramHandler:
             new_style: Новый стиль (или None для текущего)
             new_length: Новая длина (или None для текущей)
         """
-        try:
-            user_id = call.from_user.id
-            username = call.from_user.username or "без username"
+        user_id = call.from_user.id
+        username = call.from_user.username or "без username"
+
+        inflight_key = (user_id, 'rewrite', news_id)
+        if not self._claim_inflight(call, inflight_key):
+            return
+        submitted = False
 
+        try:
             # ВАЖНО: Отвечаем на callback сразу, чтобы избежать timeout
             self.bot.answer_callback_query(call.id, "⏳ Начинаю переписывание...")
 
             # Получаем статью из БД
-            news = self.db.get_news_by_id(news_id)
+            news = self._get_news_cached(news_id)
             if not news:
-                logger.warning(f"Пользователь {user_id} (@{username}) запросил переписывание несуществующей статьи {news_id}")
-                self.bot.edit_message_text(
-                    f"❌ Статья {news_id} не найдена",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id
+                logger.warning("Пользователь %s (@%s) запросил переписывание несуществующей статьи %s", user_id, username, news_id)
+                self._edit_paced(
+                    call,
+                    f"❌ Статья {news_id} не найдена"
                 )
                 return
 
             # Используем текущие настройки, если новые не указаны
             style_to_use = new_style or self.deepseek.get_style()
             length_to_use = new_length or Config.get_text_length()
+            chars = Config.AVAILABLE_TEXT_LENGTHS.get(length_to_use, Config.get_text_length_chars())
 
-            logger.info(f"Пользователь {user_id} (@{username}) начал переписывание статьи {news_id}: стиль='{style_to_use}', длина='{length_to_use}'")
+            logger.info("Пользователь %s (@%s) начал переписывание статьи %s: стиль='%s', длина='%s'", user_id, username, news_id, style_to_use, length_to_use)
 
             # Показываем сообщение о начале переписывания
-            self.bot.edit_message_text(
-                f"⏳ **Переписываю статью ID {news_id}...**\n\n"
+            self._edit_paced(
+                call,
+                f"⏳ <b>Переписываю статью ID {news_id}...</b>\n\n"
                 f"Стиль: {style_to_use}\n"
-                f"Длина: {length_to_use} ({Config.AVAILABLE_TEXT_LENGTHS.get(length_to_use, Config.get_text_length_chars())} символов)\n\n"
+                f"Длина: {length_to_use} ({chars} символов)\n\n"
                 f"Это может занять несколько секунд...",
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
 
             # Подготавливаем данные для переписывания
@@ -1962,6 +2268,43 @@ class TelegramHandler:
                 'text': news.get('original_text', '')
             }
 
+            # Запрос к DeepSeek занимает секунды - выполняем его в фоне,
+            # чтобы не занимать поток обработчиков до конца переписывания
+            self._rewrite_executor.submit(
+                self._finish_rewrite, call, news_id, article_data,
+                new_style, new_length, style_to_use, length_to_use, chars
+            )
+            submitted = True
+
+        except Exception as e:
+            logger.error("Ошибка при выполнении переписывания статьи %s для пользователя %s (@%s): %s", news_id, user_id, username, e)
+            self._report_error_async(call, f"❌ <b>Ошибка при переписывании</b>\n\n{html.escape(str(e))}")
+
+        finally:
+            # После передачи в пул отметку снимает _finish_rewrite
+            if not submitted:
+                self._release_inflight(inflight_key)
+
+    def _finish_rewrite(self, call, news_id: int, article_data: dict, new_style: Optional[str],
+                        new_length: Optional[str], style_to_use: str, length_to_use: str, chars: int):
+        """
+        Переписать статью через DeepSeek, сохранить результат и обновить сообщение
+        (выполняется в пуле переписывания)
+
+        Args:
+            call: Callback query
+            news_id: ID статьи
+            article_data: Заголовок и исходный текст статьи
+            new_style: Новый стиль (или None для текущего)
+            new_length: Новая длина (или None для текущей)
+            style_to_use: Стиль для сообщения пользователю
+            length_to_use: Длина для сообщения пользователю
+            chars: Длина в символах для сообщения пользователю
+        """
+        user_id = call.from_user.id
+        username = call.from_user.username or "без username"
+
+        try:
             # Переписываем через DeepSeek
             rewritten_text = self.deepseek.rewrite_article(
                 article_data,
@@ -1972,47 +2315,39 @@ class TelegramHandler:
             if rewritten_text:
                 # Обновляем текст в БД
                 success = self.db.update_processed_text(news_id, rewritten_text)
+                self._invalidate_news(news_id)
 
                 if success:
-                    chars = Config.AVAILABLE_TEXT_LENGTHS.get(length_to_use, Config.get_text_length_chars())
-                    logger.info(f"✅ Пользователь {user_id} (@{username}) успешно переписал статью {news_id} (стиль: {style_to_use}, длина: {length_to_use})")
-                    self.bot.edit_message_text(
-                        f"✅ **Статья ID {news_id} успешно переписана!**\n\n"
+                    logger.info("✅ Пользователь %s (@%s) успешно переписал статью %s (стиль: %s, длина: %s)", user_id, username, news_id, style_to_use, length_to_use)
+                    self._edit_paced(
+                        call,
+                        f"✅ <b>Статья ID {news_id} успешно переписана!</b>\n\n"
                         f"Стиль: {style_to_use}\n"
                         f"Длина: {length_to_use} ({chars} символов)\n\n"
                         f"Используйте /view {news_id} для просмотра результата.",
-                        chat_id=call.message.chat.id,
-                        message_id=call.message.message_id,
-                        parse_mode='Markdown'
+                        parse_mode='HTML'
                     )
                 else:
-                    logger.error(f"❌ Ошибка при сохранении переписанной статьи {news_id} в БД для пользователя {user_id} (@{username})")
-                    self.bot.edit_message_text(
+                    logger.error("❌ Ошибка при сохранении переписанной статьи %s в БД для пользователя %s (@%s)", news_id, user_id, username)
+                    self._edit_paced(
+                        call,
                         f"❌ Ошибка при сохранении переписанной статьи в БД",
-                        chat_id=call.message.chat.id,
-                        message_id=call.message.message_id,
-                        parse_mode='Markdown'
+                        parse_mode='HTML'
                     )
             else:
-                logger.error(f"❌ DeepSeek API не вернул текст при переписывании статьи {news_id} для пользователя {user_id} (@{username})")
-                self.bot.edit_message_text(
+                logger.error("❌ DeepSeek API не вернул текст при переписывании статьи %s для пользователя %s (@%s)", news_id, user_id, username)
+                self._edit_paced(
+                    call,
                     f"❌ Ошибка при переписывании статьи через DeepSeek API",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
+                    parse_mode='HTML'
                 )
 
         except Exception as e:
-            logger.error(f"Ошибка при выполнении переписывания статьи {news_id} для пользователя {user_id} (@{username}): {e}")
-            try:
-                self.bot.edit_message_text(
-                    f"❌ **Ошибка при переписывании**\n\n{str(e)}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-            except:
-                pass  # Игнорируем ошибки редактирования сообщения
+            logger.error("Ошибка при выполнении переписывания статьи %s для пользователя %s (@%s): %s", news_id, user_id, username, e)
+            self._report_error_async(call, f"❌ <b>Ошибка при переписывании</b>\n\n{html.escape(str(e))}")
+
+        finally:
+            self._release_inflight((user_id, 'rewrite', news_id))
 
     # Вспомогательные методы для обработки callback
 
@@ -2027,92 +2362,43 @@ class TelegramHandler:
             cmd_func(message)
             self.bot.answer_callback_query(call.id)
         except Exception as e:
-            logger.error(f"Ошибка при обработке команды через callback: {e}")
+            logger.error("Ошибка при обработке команды через callback: %s", e)
             self.bot.answer_callback_query(call.id, "Ошибка при выполнении команды")
 
     def _handle_view_callback(self, call, news_id: int):
         """Обработка просмотра новости через callback"""
         try:
-            logger.info(f"Просмотр новости ID: {news_id} через callback")
+            logger.info("Просмотр новости ID: %s через callback", news_id)
 
             # Получаем новость из БД
-            news = self.db.get_news_by_id(news_id)
+            news = self._get_news_cached(news_id)
             if not news:
                 self.bot.answer_callback_query(call.id, f"❌ Новость {news_id} не найдена")
                 return
 
-            # Форматируем текст для отображения
-            final_text = self._format_for_telegram_from_db(news)
-
-            # Добавляем информацию о статусе
-            status_emoji = {
-                'pending': '⏳',
-                'published': '✅',
-                'failed': '❌'
-            }
-            status = news.get('status', 'unknown')
-            status_text = f"{status_emoji.get(status, '❓')} Статус: {status}\n"
-
-            # Форматируем scheduled_time с timezone Мадрида
-            scheduled_time = news.get('scheduled_time')
-            if scheduled_time:
-                madrid_time = to_madrid_tz(scheduled_time).strftime('%Y-%m-%d %H:%M')
-                scheduled_text = f"⏰ Запланировано: {madrid_time}\n"
-            else:
-                scheduled_text = "⏰ Запланировано: не указано\n"
-
-            # Форматируем updated_at если есть
-            updated_at = news.get('updated_at')
-            if updated_at:
-                madrid_updated = to_madrid_tz(updated_at).strftime('%Y-%m-%d %H:%M')
-                updated_text = f"✏️ Изменено: {madrid_updated}\n"
-            else:
-                updated_text = ""
-
-            info_text = f"ID: {news_id}\n{status_text}{scheduled_text}{updated_text}\n{'='*30}\n\n"
-
-            # Создаем inline клавиатуру с действиями
-            keyboard = types.InlineKeyboardMarkup(row_width=2)
-
-            # Если статья еще не опубликована, добавляем кнопки действий
-            if status == 'pending':
-                keyboard.add(
-                    types.InlineKeyboardButton(
-                        "🚀 Опубликовать",
-                        callback_data=f"publish_confirm_{news_id}"
-                    ),
-                    types.InlineKeyboardButton(
-                        "✏️ Переписать",
-                        callback_data=f"rewrite_{news_id}_select_both"
-                    )
-                )
-                keyboard.add(
-                    types.InlineKeyboardButton(
-                        "🗑️ Удалить",
-                        callback_data=f"delete_confirm_{news_id}"
-                    )
-                )
-
-            keyboard.add(
-                types.InlineKeyboardButton("📋 Очередь", callback_data="cmd_queue"),
-                types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status")
-            )
+            # Текст превью и клавиатура действий
+            view_text, keyboard = self._build_news_view(news)
 
             # Отправляем новое сообщение (или редактируем текущее)
             try:
                 self.bot.edit_message_text(
-                    info_text + final_text,
+                    view_text,
                     chat_id=call.message.chat.id,
                     message_id=call.message.message_id,
                     parse_mode='HTML',
                     disable_web_page_preview=False,
                     reply_markup=keyboard
                 )
-            except:
+            except Exception as e:
+                # Сообщение уже показывает это превью (повторное нажатие кнопки) -
+                # новое сообщение не нужно
+                if 'message is not modified' in str(e):
+                    self.bot.answer_callback_query(call.id)
+                    return
                 # Если не удалось отредактировать, отправляем новое сообщение
                 self.bot.send_message(
                     call.message.chat.id,
-                    info_text + final_text,
+                    view_text,
                     parse_mode='HTML',
                     disable_web_page_preview=False,
                     reply_markup=keyboard
@@ -2121,22 +2407,18 @@ class TelegramHandler:
             self.bot.answer_callback_query(call.id)
 
         except Exception as e:
-            logger.error(f"Ошибка при просмотре новости через callback: {e}")
+            logger.error("Ошибка при просмотре новости через callback: %s", e)
             self.bot.answer_callback_query(call.id, "Ошибка при просмотре")
 
     def _handle_queue_page_callback(self, call, page: int):
         """Обработка навигации по страницам очереди"""
         try:
-            logger.info(f"Переход на страницу очереди: {page}")
+            logger.info("Переход на страницу очереди: %s", page)
 
             queue_text, keyboard = self._get_queue_page(page=page)
 
             if queue_text is None:
-                keyboard = types.InlineKeyboardMarkup(row_width=2)
-                keyboard.add(
-                    types.InlineKeyboardButton("🔄 Обновить", callback_data="cmd_queue"),
-                    types.InlineKeyboardButton("📊 Статус", callback_data="cmd_status")
-                )
+                keyboard = self._empty_queue_keyboard
                 queue_text = "Очередь пуста"
 
             # Редактируем существующее сообщение
@@ -2149,7 +2431,7 @@ class TelegramHandler:
                     reply_markup=keyboard
                 )
             except Exception as e:
-                logger.warning(f"Не удалось отредактировать сообщение: {e}")
+                logger.warning("Не удалось отредактировать сообщение: %s", e)
                 # Если не удалось отредактировать, отправляем новое
                 self.bot.send_message(
                     call.message.chat.id,
@@ -2161,206 +2443,187 @@ class TelegramHandler:
             self.bot.answer_callback_query(call.id)
 
         except Exception as e:
-            logger.error(f"Ошибка при навигации по очереди: {e}")
+            logger.error("Ошибка при навигации по очереди: %s", e)
             self.bot.answer_callback_query(call.id, "Ошибка при переключении страницы")
 
     def _show_publish_confirmation(self, call, news_id: int):
         """Показать подтверждение публикации"""
         try:
             # Получаем информацию о новости
-            news = self.db.get_news_by_id(news_id)
+            news = self._get_news_cached(news_id)
             if not news:
                 self.bot.answer_callback_query(call.id, f"❌ Новость {news_id} не найдена")
                 return
 
             # Создаем inline клавиатуру подтверждения
-            keyboard = types.InlineKeyboardMarkup(row_width=2)
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    "✅ Да, опубликовать",
-                    callback_data=f"publish_execute_{news_id}"
-                ),
-                types.InlineKeyboardButton(
-                    "❌ Отмена",
-                    callback_data="publish_cancel"
-                )
-            )
+            keyboard = self._publish_confirm_keyboard(news_id)
 
             self.bot.edit_message_text(
-                f"🚀 **Подтверждение публикации**\n\n"
+                f"🚀 <b>Подтверждение публикации</b>\n\n"
                 f"Вы хотите опубликовать новость?\n\n"
-                f"**ID:** {news_id}\n"
-                f"**Заголовок:** {news.get('title', '')[:100]}...\n\n"
+                f"<b>ID:</b> {news_id}\n"
+                f"<b>Заголовок:</b> {html.escape(news.get('title', '')[:100])}...\n\n"
                 f"Подтвердите действие:",
                 chat_id=call.message.chat.id,
                 message_id=call.message.message_id,
-                parse_mode='Markdown',
+                parse_mode='HTML',
                 reply_markup=keyboard
             )
 
             self.bot.answer_callback_query(call.id)
 
         except Exception as e:
-            logger.error(f"Ошибка при показе подтверждения публикации: {e}")
+            logger.error("Ошибка при показе подтверждения публикации: %s", e)
             self.bot.answer_callback_query(call.id, "Ошибка")
 
     def _execute_publish(self, call, news_id: int):
         """Выполнить публикацию новости"""
-        try:
-            logger.info(f"Выполнение публикации новости ID: {news_id}")
-
-            # ВАЖНО: Отвечаем на callback сразу, чтобы избежать timeout
-            self.bot.answer_callback_query(call.id, "⏳ Публикую...")
-
-            self.bot.edit_message_text(
-                f"⏳ Публикую новость ID {news_id}...",
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id
-            )
-
-            success = self.publish_news_by_id(news_id)
-
-            if success:
-                self.bot.edit_message_text(
-                    f"✅ **Новость успешно опубликована!**\n\nID: {news_id}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-            else:
-                self.bot.edit_message_text(
-                    f"❌ **Ошибка при публикации новости**\n\nID: {news_id}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-
-        except Exception as e:
-            logger.error(f"Ошибка при выполнении публикации через callback: {e}")
-            try:
-                self.bot.edit_message_text(
-                    f"❌ **Ошибка при публикации**\n\n{str(e)}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-            except:
-                pass  # Игнорируем ошибки редактирования сообщения
+        logger.info("Выполнение публикации новости ID: %s", news_id)
+
+        # Отправка в канал может ждать flood control - публикуем в общем потоке
+        # публикаций (сохраняет порядок со срочными новостями)
+        self._run_callback_operation(
+            call,
+            lambda: self.publish_news_by_id(news_id),
+            inflight_key=(call.from_user.id, 'publish', news_id),
+            answer_text="⏳ Публикую...",
+            success_text=f"✅ <b>Новость успешно опубликована!</b>\n\nID: {news_id}",
+            failure_text=f"❌ <b>Ошибка при публикации новости</b>\n\nID: {news_id}",
+            error_text="Ошибка при публикации",
+            progress_text=f"⏳ Публикую новость ID {news_id}...",
+            executor=self._publish_executor
+        )
 
     def _show_delete_confirmation(self, call, news_id: int):
         """Показать подтверждение удаления"""
         try:
             # Получаем информацию о новости
-            news = self.db.get_news_by_id(news_id)
+            news = self._get_news_cached(news_id)
             if not news:
                 self.bot.answer_callback_query(call.id, f"❌ Новость {news_id} не найдена")
                 return
 
             # Создаем inline клавиатуру подтверждения
-            keyboard = types.InlineKeyboardMarkup(row_width=2)
-            keyboard.add(
-                types.InlineKeyboardButton(
-                    "✅ Да, удалить",
-                    callback_data=f"delete_execute_{news_id}"
-                ),
-                types.InlineKeyboardButton(
-                    "❌ Отмена",
-                    callback_data="delete_cancel"
-                )
-            )
+            keyboard = self._delete_confirm_keyboard(news_id)
 
             self.bot.edit_message_text(
-                f"⚠️ **Подтверждение удаления**\n\n"
+                f"⚠️ <b>Подтверждение удаления</b>\n\n"
                 f"Вы действительно хотите удалить новость?\n\n"
-                f"**ID:** {news_id}\n"
-                f"**Заголовок:** {news.get('title', '')[:100]}...\n\n"
+                f"<b>ID:</b> {news_id}\n"
+                f"<b>Заголовок:</b> {html.escape(news.get('title', '')[:100])}...\n\n"
                 f"Это действие нельзя отменить!",
                 chat_id=call.message.chat.id,
                 message_id=call.message.message_id,
-                parse_mode='Markdown',
+                parse_mode='HTML',
                 reply_markup=keyboard
             )
 
             self.bot.answer_callback_query(call.id)
 
         except Exception as e:
-            logger.error(f"Ошибка при показе подтверждения удаления: {e}")
+            logger.error("Ошибка при показе подтверждения удаления: %s", e)
             self.bot.answer_callback_query(call.id, "Ошибка")
 
     def _execute_delete(self, call, news_id: int):
         """Выполнить удаление новости"""
-        try:
-            logger.info(f"Удаление новости ID: {news_id}")
+        logger.info("Удаление новости ID: %s", news_id)
 
-            # ВАЖНО: Отвечаем на callback сразу, чтобы избежать timeout
-            self.bot.answer_callback_query(call.id, "⏳ Удаляю...")
-
-            # Удаляем новость из БД
+        def delete():
             success = self.db.delete_news(news_id)
-
-            if success:
-                self.bot.edit_message_text(
-                    f"✅ **Новость удалена!**\n\nID: {news_id}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-            else:
-                self.bot.edit_message_text(
-                    f"❌ **Ошибка при удалении новости**\n\nID: {news_id}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-
-        except Exception as e:
-            logger.error(f"Ошибка при удалении новости через callback: {e}")
-            try:
-                self.bot.edit_message_text(
-                    f"❌ **Ошибка при удалении**\n\n{str(e)}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-            except:
-                pass  # Игнорируем ошибки редактирования сообщения
+            self._invalidate_news(news_id)
+            return success
+
+        self._run_callback_operation(
+            call,
+            delete,
+            inflight_key=(call.from_user.id, 'delete', news_id),
+            answer_text="⏳ Удаляю...",
+            success_text=f"✅ <b>Новость удалена!</b>\n\nID: {news_id}",
+            failure_text=f"❌ <b>Ошибка при удалении новости</b>\n\nID: {news_id}",
+            error_text="Ошибка при удалении"
+        )
 
     def _execute_clear_queue(self, call):
         """Выполнить очистку очереди"""
-        try:
-            logger.info("Выполнение очистки очереди")
-
-            # ВАЖНО: Отвечаем на callback сразу, чтобы избежать timeout
-            self.bot.answer_callback_query(call.id, "⏳ Очищаю...")
+        logger.info("Выполнение очистки очереди")
 
+        def clear():
             success = self.db.clear_queue()
+            self._invalidate_news()
+            return success
+
+        self._run_callback_operation(
+            call,
+            clear,
+            inflight_key=(call.from_user.id, 'clear_queue', None),
+            answer_text="⏳ Очищаю...",
+            success_text="✅ <b>Очередь очищена!</b>\n\nВсе новости в ожидании были удалены.",
+            failure_text="❌ <b>Ошибка при очистке очереди</b>",
+            error_text="Ошибка при очистке очереди"
+        )
 
-            if success:
-                self.bot.edit_message_text(
-                    "✅ **Очередь очищена!**\n\nВсе новости в ожидании были удалены.",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
+    def _run_callback_operation(self, call, operation: Callable[[], bool], inflight_key: tuple,
+                                answer_text: str, success_text: str, failure_text: str,
+                                error_text: str, progress_text: Optional[str] = None,
+                                executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Выполнить операцию подтвержденного действия и показать результат в сообщении
+
+        Сразу отвечает на callback (чтобы избежать timeout), затем выполняет
+        операцию в текущем потоке или в переданном пуле. Повторное нажатие
+        до завершения операции игнорируется.
+
+        Args:
+            call: Callback запрос
+            operation: Операция, возвращающая признак успеха
+            inflight_key: (user_id, действие, news_id) для отсечения повторных нажатий
+            answer_text: Текст ответа на callback
+            success_text: Текст сообщения при успехе (HTML)
+            failure_text: Текст сообщения при неудаче (HTML)
+            error_text: Заголовок сообщения об исключении
+            progress_text: Текст сообщения на время выполнения (если None - не показывается)
+            executor: Пул для выполнения операции (если None - в текущем потоке)
+        """
+        if not self._claim_inflight(call, inflight_key):
+            return
+        submitted = False
+
+        try:
+            self.bot.answer_callback_query(call.id, answer_text)
+
+            if progress_text:
+                self._edit_paced(call, progress_text)
+
+            if executor is not None:
+                executor.submit(self._finish_callback_operation, call, operation, inflight_key,
+                                success_text, failure_text, error_text)
             else:
-                self.bot.edit_message_text(
-                    "❌ **Ошибка при очистке очереди**",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
+                self._finish_callback_operation(call, operation, inflight_key,
+                                                success_text, failure_text, error_text)
+            submitted = True
 
         except Exception as e:
-            logger.error(f"Ошибка при очистке очереди через callback: {e}")
-            try:
-                self.bot.edit_message_text(
-                    f"❌ **Ошибка при очистке очереди**\n\n{str(e)}",
-                    chat_id=call.message.chat.id,
-                    message_id=call.message.message_id,
-                    parse_mode='Markdown'
-                )
-            except:
-                pass  # Игнорируем ошибки редактирования сообщения
+            logger.error("%s через callback: %s", error_text, e)
+            self._report_error_async(call, f"❌ <b>{error_text}</b>\n\n{html.escape(str(e))}")
+
+        finally:
+            # Переданную операцию отметку снимает _finish_callback_operation
+            if not submitted:
+                self._release_inflight(inflight_key)
+
+    def _finish_callback_operation(self, call, operation: Callable[[], bool], inflight_key: tuple,
+                                   success_text: str, failure_text: str, error_text: str):
+        """Выполнить операцию и отредактировать сообщение с результатом"""
+        try:
+            success = operation()
+            self._edit_paced(call, success_text if success else failure_text, parse_mode='HTML')
+
+        except Exception as e:
+            logger.error("%s через callback: %s", error_text, e)
+            self._report_error_async(call, f"❌ <b>{error_text}</b>\n\n{html.escape(str(e))}")
+
+        finally:
+            self._release_inflight(inflight_key)
 
     def _handle_cancel_callback(self, call, message: str):
         """Обработка отмены действия"""
@@ -2372,7 +2635,7 @@ class TelegramHandler:
             )
             self.bot.answer_callback_query(call.id, message)
         except Exception as e:
-            logger.error(f"Ошибка при обработке отмены: {e}")
+            logger.error("Ошибка при обработке отмены: %s", e)
             self.bot.answer_callback_query(call.id, message)
 
     def start_polling(self):
@@ -2384,9 +2647,16 @@ class TelegramHandler:
             self.bot.remove_webhook()
             logger.info("Webhook удален, запускаем polling")
         except Exception as e:
-            logger.warning(f"Не удалось удалить webhook: {e}")
-
-        self.bot.infinity_polling(none_stop=True, interval=1)
+            logger.warning("Не удалось удалить webhook: %s", e)
+
+        # Long polling: сервер Telegram держит запрос до LONG_POLLING_TIMEOUT секунд и отвечает сразу
+        # при появлении обновлений, поэтому дополнительная пауза между запросами не нужна
+        self.bot.infinity_polling(
+            timeout=20,
+            long_polling_timeout=LONG_POLLING_TIMEOUT,
+            interval=0,
+            allowed_updates=ALLOWED_UPDATES
+        )
 
     def set_webhook(self):
         """
@@ -2401,9 +2671,9 @@ class TelegramHandler:
         logger.info("=" * 60)
         logger.info("🔧 АВТОМАТИЧЕСКАЯ УСТАНОВКА WEBHOOK")
         logger.info("=" * 60)
-        logger.info(f"📍 Webhook URL: {webhook_url}")
-        logger.info(f"📍 Базовый URL: {Config.WEBHOOK_URL}")
-        logger.info(f"📍 Путь: {Config.WEBHOOK_PATH}")
+        logger.info("📍 Webhook URL: %s", webhook_url)
+        logger.info("📍 Базовый URL: %s", Config.WEBHOOK_URL)
+        logger.info("📍 Путь: %s", Config.WEBHOOK_PATH)
 
         try:
             # Удаляем предыдущий webhook если был
@@ -2415,6 +2685,7 @@ class TelegramHandler:
             logger.info("⚙️  Установка нового webhook...")
             self.bot.set_webhook(
                 url=webhook_url,
+                allowed_updates=ALLOWED_UPDATES,
                 drop_pending_updates=False  # Не пропускаем ожидающие обновления
             )
 
@@ -2425,23 +2696,22 @@ class TelegramHandler:
             logger.info("=" * 60)
             logger.info("✅ WEBHOOK УСТАНОВЛЕН УСПЕШНО!")
             logger.info("=" * 60)
-            logger.info(f"📌 URL: {webhook_info.url}")
-            logger.info(f"📌 Ожидающих обновлений: {webhook_info.pending_update_count}")
+            logger.info("📌 URL: %s", webhook_info.url)
+            logger.info("📌 Ожидающих обновлений: %s", webhook_info.pending_update_count)
 
             if webhook_info.has_custom_certificate:
-                logger.info(f"📌 Используется пользовательский сертификат")
+                logger.info("📌 Используется пользовательский сертификат")
 
             if webhook_info.max_connections:
-                logger.info(f"📌 Макс. соединений: {webhook_info.max_connections}")
+                logger.info("📌 Макс. соединений: %s", webhook_info.max_connections)
 
             # Проверяем наличие ошибок
             if webhook_info.last_error_date:
-                from datetime import datetime
                 error_date = datetime.fromtimestamp(webhook_info.last_error_date)
                 logger.warning("=" * 60)
                 logger.warning("⚠️  ОБНАРУЖЕНА ПРЕДЫДУЩАЯ ОШИБКА WEBHOOK")
-                logger.warning(f"⚠️  Дата: {error_date.strftime('%Y-%m-%d %H:%M:%S')}")
-                logger.warning(f"⚠️  Сообщение: {webhook_info.last_error_message}")
+                logger.warning("⚠️  Дата: %s", error_date.strftime('%Y-%m-%d %H:%M:%S'))
+                logger.warning("⚠️  Сообщение: %s", webhook_info.last_error_message)
                 logger.warning("=" * 60)
 
             logger.info("=" * 60)
@@ -2455,7 +2725,7 @@ class TelegramHandler:
             logger.error("=" * 60)
             logger.error("❌ ОШИБКА ПРИ УСТАНОВКЕ WEBHOOK")
             logger.error("=" * 60)
-            logger.error(f"❌ {type(e).__name__}: {e}")
+            logger.error("❌ %s: %s", type(e).__name__, e)
             logger.error("💡 Возможные причины:")
             logger.error("   1. WEBHOOK_URL не является HTTPS адресом")
             logger.error("   2. Домен недоступен из интернета")
@@ -2475,7 +2745,7 @@ class TelegramHandler:
             self.set_webhook()
             logger.info("Бот готов принимать обновления через webhook")
         except Exception as e:
-            logger.error(f"Не удалось запустить webhook: {e}")
+            logger.error("Не удалось запустить webhook: %s", e)
             raise
 
     def process_webhook_update(self, update_data: dict):
@@ -2489,12 +2759,14 @@ class TelegramHandler:
             # Преобразуем JSON в объект Update для telebot
             update = telebot.types.Update.de_json(update_data)
 
-            # Обрабатываем обновление через bot
+            # Бот создан с threaded=True: process_new_updates только выбирает обработчик
+            # и ставит его в пул потоков telebot (HANDLER_WORKERS), поэтому webhook
+            # получает ответ 200, не дожидаясь выполнения команды
             self.bot.process_new_updates([update])
 
-            logger.debug(f"Webhook обновление обработано: {update.update_id}")
+            logger.debug("Webhook обновление обработано: %s", update.update_id)
         except Exception as e:
-            logger.error(f"Ошибка при обработке webhook обновления: {e}", exc_info=True)
+            logger.error("Ошибка при обработке webhook обновления: %s", e, exc_info=True)
             raise
 
     def stop(self):
@@ -2504,3 +2776,11 @@ class TelegramHandler:
             self.bot.stop_polling()
         except:
             pass  # Polling может не работать в webhook режиме
+
+        # Новые сообщения больше не принимаем, уже начатая обработка завершается в фоне
+        self._url_executor.shutdown(wait=False)
+        self._fetch_executor.shutdown(wait=False)
+        self._publish_executor.shutdown(wait=False)
+        self._rewrite_executor.shutdown(wait=False)
+        self._callback_answer_executor.shutdown(wait=False)
+        self._error_report_executor.shutdown(wait=False)
@@ -0,0 +1,58 @@
+"""
+Тесты TelegramHandler: форматирование публикаций и кэш новостей
+"""
+import threading
+import unittest
+from collections import OrderedDict
+from unittest import mock
+
+import telegram_handler
+from telegram_handler import TelegramHandler
+
+
+class FormatForTelegramTest(unittest.TestCase):
+    """Обрезка длинного текста в _format_for_telegram_from_db"""
+
+    def setUp(self):
+        # Форматирование не использует состояние бота, поэтому __init__ не вызываем
+        self.handler = object.__new__(TelegramHandler)
+
+    def test_truncation_drops_cut_entity_after_complete_one(self):
+        # "<b>abcdefghijk&lt;&gt;xyz</b>": на 20-м символе обрывается вторая сущность (&g)
+        news = {'processed_text': 'abcdefghijk<>xyz', 'url': ''}
+
+        with mock.patch.object(telegram_handler, '_TEXT_LENGTH_BUDGET', 20):
+            text = self.handler._format_for_telegram_from_db(news)
+
+        self.assertTrue(text.startswith('<b>abcdefghijk&lt;...'))
+
+
+class NewsCacheTest(unittest.TestCase):
+    """Кэш новостей _get_news_cached"""
+
+    def setUp(self):
+        self.handler = object.__new__(TelegramHandler)
+        self.handler._news_cache = OrderedDict()
+        self.handler._news_cache_lock = threading.Lock()
+        self.handler._news_cache_generation = 0
+        self.handler.db = mock.Mock()
+
+    def test_row_read_before_invalidation_is_not_cached(self):
+        stale = {'id': 1, 'processed_text': 'old'}
+        fresh = {'id': 1, 'processed_text': 'new'}
+
+        def read_then_rewrite(news_id):
+            # Переписывание завершилось, пока строка читалась из БД
+            self.handler._invalidate_news(news_id)
+            return stale
+
+        self.handler.db.get_news_by_id.side_effect = read_then_rewrite
+        self.assertIs(self.handler._get_news_cached(1), stale)
+
+        self.handler.db.get_news_by_id.side_effect = None
+        self.handler.db.get_news_by_id.return_value = fresh
+        self.assertIs(self.handler._get_news_cached(1), fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
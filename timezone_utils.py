@@ -7,6 +7,9 @@ from zoneinfo import ZoneInfo
 # Часовой пояс Мадрида
 MADRID_TZ = ZoneInfo("Europe/Madrid")
 
+# UTC - для naive datetime из БД (создается один раз, а не при каждой конвертации)
+UTC_TZ = ZoneInfo("UTC")
+
 
 def now_madrid() -> datetime:
     """
@@ -30,7 +33,7 @@ def to_madrid_tz(dt: datetime) -> datetime:
     """
     if dt.tzinfo is None:
         # Если naive datetime, считаем что это UTC
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=UTC_TZ)
 
     return dt.astimezone(MADRID_TZ)
 